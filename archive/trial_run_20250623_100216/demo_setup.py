@@ -10,6 +10,19 @@ import subprocess
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def write_json(data, path):
+    """Write indented JSON, using orjson when it is installed"""
+    if orjson is not None:
+        Path(path).write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+    else:
+        with open(path, 'w') as f:
+            json.dump(data, f, indent=2)
+
 def create_demo_structure():
     """Create the standardized demo file structure"""
     
@@ -45,10 +58,20 @@ def install_required_packages():
         "openpyxl"
     ]
     
+    pip_command = [sys.executable, "-m", "pip", "install", "--no-input", "--disable-pip-version-check"]
+    
     print("Installing required packages...")
+    try:
+        # One pip run resolves and installs everything together
+        subprocess.check_call(pip_command + packages)
+        print(f"✓ Installed {', '.join(packages)}")
+        return
+    except subprocess.CalledProcessError:
+        print("✗ Batch install failed, retrying packages one by one...")
+    
     for package in packages:
         try:
-            subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            subprocess.check_call(pip_command + [package])
             print(f"✓ Installed {package}")
         except subprocess.CalledProcessError:
             print(f"✗ Failed to install {package}")
@@ -96,8 +119,7 @@ def create_sample_data():
     
     # Save sample data
     data_file = Path("patent_demo/data/sample_patents.json")
-    with open(data_file, 'w') as f:
-        json.dump(sample_patents, f, indent=2)
+    write_json(sample_patents, data_file)
     
     print(f"✓ Created sample data: {data_file}")
 
@@ -123,8 +145,7 @@ def create_config_files():
     }
     
     config_file = Path("patent_demo/config/demo_config.json")
-    with open(config_file, 'w') as f:
-        json.dump(config, f, indent=2)
+    write_json(config, config_file)
     
     print(f"✓ Created config file: {config_file}")
 
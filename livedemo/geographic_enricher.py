@@ -1,6 +1,50 @@
+from collections import Counter
+
 import pandas as pd
 from database_connection import get_patstat_connection
 
+# Regional groupings (based on common patent analytics), built once at import
+REGION_BY_COUNTRY = pd.Series({
+    'US': 'North America',
+    'CA': 'North America',
+    'MX': 'North America',
+    'JP': 'Asia Pacific',
+    'CN': 'Asia Pacific', 
+    'KR': 'Asia Pacific',
+    'IN': 'Asia Pacific',
+    'AU': 'Asia Pacific',
+    'SG': 'Asia Pacific',
+    'TW': 'Asia Pacific',
+    'DE': 'Europe',
+    'GB': 'Europe',
+    'FR': 'Europe',
+    'IT': 'Europe',
+    'NL': 'Europe',
+    'SE': 'Europe',
+    'CH': 'Europe',
+    'DK': 'Europe',
+    'FI': 'Europe',
+    'NO': 'Europe',
+    'AT': 'Europe',
+    'BE': 'Europe',
+    'ES': 'Europe',
+    'PT': 'Europe',
+    'IE': 'Europe',
+    'LU': 'Europe',
+    'BR': 'Latin America',
+    'AR': 'Latin America',
+    'CL': 'Latin America',
+    'CO': 'Latin America',
+    'PE': 'Latin America',
+    'RU': 'Eurasia',
+    'TR': 'Eurasia',
+    'IL': 'Middle East & Africa',
+    'ZA': 'Middle East & Africa',
+    'EG': 'Middle East & Africa',
+    'SA': 'Middle East & Africa',
+    'AE': 'Middle East & Africa'
+})
+
 def enrich_with_geographic_data(db, ree_df):
     """Add comprehensive country information"""
     
@@ -57,51 +101,9 @@ def get_geographic_distribution(enriched_df):
     # Country distribution analysis
     country_dist = enriched_df['primary_applicant_country'].value_counts()
     
-    # Regional groupings (based on common patent analytics)
-    regional_mapping = {
-        'US': 'North America',
-        'CA': 'North America',
-        'MX': 'North America',
-        'JP': 'Asia Pacific',
-        'CN': 'Asia Pacific', 
-        'KR': 'Asia Pacific',
-        'IN': 'Asia Pacific',
-        'AU': 'Asia Pacific',
-        'SG': 'Asia Pacific',
-        'TW': 'Asia Pacific',
-        'DE': 'Europe',
-        'GB': 'Europe',
-        'FR': 'Europe',
-        'IT': 'Europe',
-        'NL': 'Europe',
-        'SE': 'Europe',
-        'CH': 'Europe',
-        'DK': 'Europe',
-        'FI': 'Europe',
-        'NO': 'Europe',
-        'AT': 'Europe',
-        'BE': 'Europe',
-        'ES': 'Europe',
-        'PT': 'Europe',
-        'IE': 'Europe',
-        'LU': 'Europe',
-        'BR': 'Latin America',
-        'AR': 'Latin America',
-        'CL': 'Latin America',
-        'CO': 'Latin America',
-        'PE': 'Latin America',
-        'RU': 'Eurasia',
-        'TR': 'Eurasia',
-        'IL': 'Middle East & Africa',
-        'ZA': 'Middle East & Africa',
-        'EG': 'Middle East & Africa',
-        'SA': 'Middle East & Africa',
-        'AE': 'Middle East & Africa'
-    }
-    
     # Add regional classification
     enriched_df_copy = enriched_df.copy()
-    enriched_df_copy['region'] = enriched_df_copy['primary_applicant_country'].map(regional_mapping)
+    enriched_df_copy['region'] = enriched_df_copy['primary_applicant_country'].map(REGION_BY_COUNTRY)
     enriched_df_copy['region'] = enriched_df_copy['region'].fillna('Other')
     
     regional_dist = enriched_df_copy['region'].value_counts()
@@ -166,17 +168,13 @@ def analyze_geographic_collaboration(db, ree_df):
         }
         
         # Most common collaboration patterns
-        country_pair_analysis = {}
-        for _, row in collaboration_data.iterrows():
-            countries = sorted(row['collaborating_countries'].split(','))
-            if len(countries) == 2:
-                pair = f"{countries[0]}-{countries[1]}"
-                country_pair_analysis[pair] = country_pair_analysis.get(pair, 0) + 1
+        country_lists = (sorted(countries.split(',')) for countries in collaboration_data['collaborating_countries'])
+        country_pair_analysis = Counter(
+            f"{countries[0]}-{countries[1]}" for countries in country_lists if len(countries) == 2
+        )
         
         if country_pair_analysis:
-            collaboration_analysis['top_bilateral_collaborations'] = dict(
-                sorted(country_pair_analysis.items(), key=lambda x: x[1], reverse=True)[:5]
-            )
+            collaboration_analysis['top_bilateral_collaborations'] = dict(country_pair_analysis.most_common(5))
     else:
         print("❌ No international collaborations found")
         collaboration_analysis = {
@@ -4,6 +4,7 @@ from datetime import datetime
 from typing import Dict, List, Tuple, Optional
 import json
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from usgs_market_collector import USGSMineralDataCollector
 from patent_market_correlator import PatentMarketCorrelator
@@ -602,6 +603,14 @@ class REEBusinessIntelligence:
         }
         return total_losses.get(sector, 25000000000)
     
+    @staticmethod
+    def _json_writer(data: Dict):
+        """Return a writer that dumps data as indented JSON to a given path"""
+        def write(path: str):
+            with open(path, 'w', buffering=1 << 20) as f:
+                json.dump(data, f, indent=2)
+        return write
+    
     def export_business_reports(self, reports: List[BusinessReport], output_dir: str = 'business_intelligence_reports') -> Dict:
         """Export business intelligence reports in multiple formats"""
         print(f"📄 EXPORTING BUSINESS INTELLIGENCE REPORTS")
@@ -610,7 +619,8 @@ class REEBusinessIntelligence:
         # Create output directory
         os.makedirs(output_dir, exist_ok=True)
         
-        exported_files = []
+        # Collect (path, writer) tasks; every report file is independent so they are written concurrently
+        export_tasks = []
         
         for report in reports:
             timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
@@ -632,17 +642,21 @@ class REEBusinessIntelligence:
                 'implementation_roadmap': report.implementation_roadmap,
                 'appendices': report.appendices
             }
-            
-            with open(json_filename, 'w') as f:
-                json.dump(report_data, f, indent=2)
-            exported_files.append(json_filename)
+            export_tasks.append((json_filename, self._json_writer(report_data)))
             
             # Export executive summary as CSV
             csv_filename = os.path.join(output_dir, f"{base_filename}_executive_summary.csv")
             exec_summary_df = pd.DataFrame([report.executive_summary])
-            exec_summary_df.to_csv(csv_filename, index=False)
-            exported_files.append(csv_filename)
-            
+            export_tasks.append((csv_filename, lambda path, df=exec_summary_df: df.to_csv(path, index=False)))
+        
+        if export_tasks:
+            with ThreadPoolExecutor(max_workers=min(len(export_tasks), 8)) as executor:
+                futures = [executor.submit(writer, path) for path, writer in export_tasks]
+                for future in futures:
+                    future.result()
+        
+        exported_files = [path for path, _ in export_tasks]
+        for report in reports:
             print(f"✅ Exported {report.report_type} for {report.client_segment}")
         
         export_summary = {
@@ -655,7 +669,7 @@ class REEBusinessIntelligence:
         
         # Create export summary file
         summary_filename = os.path.join(output_dir, f"export_summary_{timestamp}.json")
-        with open(summary_filename, 'w') as f:
+        with open(summary_filename, 'w', buffering=1 << 20) as f:
             json.dump(export_summary, f, indent=2)
         
         print(f"✅ Business intelligence export completed")
@@ -1,13 +1,26 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from database_connection import get_patstat_connection
+from database_connection import get_patstat_connection, disk_cache, ids_digest, format_id_list
+
+# Low-cardinality citation columns stored as categoricals at ingest
+CITATION_CATEGORY_COLUMNS = ('citing_country', 'cited_country', 'citn_origin')
 
-def get_forward_citations(db, ree_appln_ids, test_mode=True):
+def categoricalize_citations(citations_df):
+    """Convert low-cardinality citation columns to category dtype"""
+    for col in CITATION_CATEGORY_COLUMNS:
+        if col in citations_df.columns:
+            citations_df[col] = citations_df[col].astype('category')
+    return citations_df
+
+@disk_cache(key_fn=lambda db, ree_appln_ids, test_mode=True: f'forward_citations_{test_mode}_{ids_digest(ree_appln_ids)}')
+def get_forward_citations(db, ree_appln_ids, test_mode=True, log=print):
     """Find forward citations via correct publication linkage"""
     
-    if not ree_appln_ids:
+    if len(ree_appln_ids) == 0:
         return pd.DataFrame()
     
-    appln_ids_str = ','.join(map(str, ree_appln_ids))
+    appln_ids_str = format_id_list(ree_appln_ids)
     
     # Step 1: Get publication IDs for REE applications
     ree_publications_query = f"""
@@ -16,16 +29,16 @@ def get_forward_citations(db, ree_appln_ids, test_mode=True):
     WHERE appln_id IN ({appln_ids_str})
     """
     
-    print("🔍 Getting publication IDs for REE applications...")
+    log("🔍 Getting publication IDs for REE applications...")
     ree_publications = pd.read_sql(ree_publications_query, db.bind)
     
     if ree_publications.empty:
-        print("❌ No publications found for forward citations")
+        log("❌ No publications found for forward citations")
         return pd.DataFrame()
     
-    print(f"Found {len(ree_publications)} publications for {len(ree_appln_ids)} applications")
+    log(f"Found {len(ree_publications)} publications for {len(ree_appln_ids)} applications")
     
-    publn_ids_str = ','.join(map(str, ree_publications['ree_publn_id']))
+    publn_ids_str = format_id_list(ree_publications['ree_publn_id'])
     
     # Step 2: Find citations via publication linkage
     forward_query = f"""
@@ -48,47 +61,48 @@ def get_forward_citations(db, ree_appln_ids, test_mode=True):
     if test_mode:
         forward_query += " LIMIT 2000"
     
-    print("🔍 Analyzing forward citations...")
-    forward_citations = pd.read_sql(forward_query, db.bind)
+    log("🔍 Analyzing forward citations...")
+    forward_citations = categoricalize_citations(pd.read_sql(forward_query, db.bind))
     
     if not forward_citations.empty:
-        print(f"✅ Found {len(forward_citations)} forward citations")
+        log(f"✅ Found {len(forward_citations)} forward citations")
         origin_counts = forward_citations['citn_origin'].value_counts()
-        print(f"Citation Origins: {origin_counts.to_dict()}")
+        log(f"Citation Origins: {origin_counts.to_dict()}")
         
         # Citation analysis
         citing_countries = forward_citations['citing_country'].value_counts()
-        print(f"Top Citing Countries: {citing_countries.head(5).to_dict()}")
+        log(f"Top Citing Countries: {citing_countries.head(5).to_dict()}")
         
         citing_years = forward_citations['citing_year'].value_counts().sort_index()
-        print(f"Citation Years: {citing_years.tail(5).to_dict()}")
+        log(f"Citation Years: {citing_years.tail(5).to_dict()}")
     else:
-        print("❌ No forward citations found")
+        log("❌ No forward citations found")
     
     return forward_citations
 
-def get_backward_citations(db, ree_appln_ids, test_mode=True):
+@disk_cache(key_fn=lambda db, ree_appln_ids, test_mode=True: f'backward_citations_{test_mode}_{ids_digest(ree_appln_ids)}')
+def get_backward_citations(db, ree_appln_ids, test_mode=True, log=print):
     """Find backward citations via publication linkage"""
     
-    if not ree_appln_ids:
+    if len(ree_appln_ids) == 0:
         return pd.DataFrame()
     
     # Get publication IDs for our REE patents
     publn_query = f"""
     SELECT pat_publn_id, appln_id FROM tls211_pat_publn
-    WHERE appln_id IN ({','.join(map(str, ree_appln_ids))})
+    WHERE appln_id IN ({format_id_list(ree_appln_ids)})
     """
     
-    print("🔍 Getting publication IDs for backward citation analysis...")
+    log("🔍 Getting publication IDs for backward citation analysis...")
     ree_publications = pd.read_sql(publn_query, db.bind)
     
     if ree_publications.empty:
-        print("❌ No publications found for backward citations")
+        log("❌ No publications found for backward citations")
         return pd.DataFrame()
     
-    print(f"Found {len(ree_publications)} publications for backward citation analysis")
+    log(f"Found {len(ree_publications)} publications for backward citation analysis")
     
-    publn_ids_str = ','.join(map(str, ree_publications['pat_publn_id']))
+    publn_ids_str = format_id_list(ree_publications['pat_publn_id'])
     
     # Backward citations
     backward_query = f"""
@@ -112,30 +126,50 @@ def get_backward_citations(db, ree_appln_ids, test_mode=True):
     if test_mode:
         backward_query += " LIMIT 2000"
     
-    print("🔍 Analyzing backward citations...")
-    backward_citations = pd.read_sql(backward_query, db.bind)
+    log("🔍 Analyzing backward citations...")
+    backward_citations = categoricalize_citations(pd.read_sql(backward_query, db.bind))
     
     if not backward_citations.empty:
-        print(f"✅ Found {len(backward_citations)} backward citations")
+        log(f"✅ Found {len(backward_citations)} backward citations")
         cited_years = backward_citations['cited_year'].dropna()
         if not cited_years.empty:
-            print(f"Prior Art Range: {cited_years.min()}-{cited_years.max()}")
+            log(f"Prior Art Range: {cited_years.min()}-{cited_years.max()}")
         
         # Citation origin analysis
         origin_counts = backward_citations['citn_origin'].value_counts()
-        print(f"Citation Origins: {origin_counts.to_dict()}")
+        log(f"Citation Origins: {origin_counts.to_dict()}")
         
         # Technology heritage analysis
         cited_countries = backward_citations['cited_country'].value_counts()
-        print(f"Cited Countries: {cited_countries.head(5).to_dict()}")
+        log(f"Cited Countries: {cited_countries.head(5).to_dict()}")
     else:
-        print("❌ No backward citations found")
+        log("❌ No backward citations found")
     
     return backward_citations
 
+def get_all_citations(db, ree_appln_ids, test_mode=True):
+    """Fetch forward and backward citations concurrently, returning (forward_df, backward_df)"""
+    
+    # The two directions select different columns, so run both queries side by side
+    # on separate pooled connections instead of forcing them into one UNION.
+    # Each direction logs into its own list; the lines are printed forward first, then backward
+    forward_log, backward_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        forward_future = executor.submit(get_forward_citations, db, ree_appln_ids, test_mode, log=forward_log.append)
+        backward_future = executor.submit(get_backward_citations, db, ree_appln_ids, test_mode, log=backward_log.append)
+    
+    try:
+        return forward_future.result(), backward_future.result()
+    finally:
+        for line in forward_log + backward_log:
+            print(line)
+
 def analyze_citation_patterns(forward_cit_df, backward_cit_df):
     """Analyze citation patterns for insights"""
     
+    if forward_cit_df.empty and backward_cit_df.empty:
+        return {}
+    
     citation_analysis = {}
     
     if not forward_cit_df.empty:
@@ -190,15 +224,10 @@ def analyze_citations_for_ree_dataset(ree_appln_ids, test_mode=True):
         print("❌ Database connection failed")
         return None
     
-    # Forward citations
-    print("\n📈 FORWARD CITATION ANALYSIS")
-    print("-" * 30)
-    forward_cit = get_forward_citations(db, ree_appln_ids, test_mode)
-    
-    # Backward citations  
-    print("\n📉 BACKWARD CITATION ANALYSIS")
+    # Forward and backward citations
+    print("\n📈📉 FORWARD + BACKWARD CITATION ANALYSIS")
     print("-" * 30)
-    backward_cit = get_backward_citations(db, ree_appln_ids, test_mode)
+    forward_cit, backward_cit = get_all_citations(db, ree_appln_ids, test_mode)
     
     # Pattern analysis
     print("\n📊 CITATION PATTERN ANALYSIS")
@@ -1,19 +1,55 @@
+import json
+import math
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
 import pandas as pd
 from database_connection import get_patstat_connection
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Quality score bands as (ascending lower bounds, points); a value earns the points of the highest bound it reaches
+APPLICATION_BANDS = ((50, 100, 200, 500, 1000), (0, 5, 10, 15, 20, 25))
+CITATION_BANDS = ((50, 200, 500, 1000, 2000), (0, 5, 10, 15, 20, 25))
+COUNTRY_BANDS = ((3, 5, 10, 15, 20), (0, 5, 8, 12, 15, 20))
+# math.ulp(0.0) is the smallest positive float, so the first band means "any ratio above zero"
+FAMILY_RATIO_BANDS = ((math.ulp(0.0), 0.2, 0.4, 0.6, 0.8), (0, 3, 6, 9, 12, 15))
+APPLICANT_COUNTRY_BANDS = ((1, 3, 5, 10, 15), (0, 1, 2, 3, 4, 5))
+
+def band_points(value, bands):
+    """Points for value from a (lower bounds, points) band table"""
+    thresholds, points = bands
+    return points[bisect_right(thresholds, value)]
+
 def validate_dataset_quality(ree_df, forward_citations_df, backward_citations_df, geographic_analysis=None):
     """Comprehensive quality assessment"""
     
     # Basic dataset metrics
     quality_metrics = {
-        'total_applications': len(ree_df) if not ree_df.empty else 0,
-        'total_families': ree_df['docdb_family_id'].nunique() if not ree_df.empty else 0,
-        'forward_citations': len(forward_citations_df) if not forward_citations_df.empty else 0,
-        'backward_citations': len(backward_citations_df) if not backward_citations_df.empty else 0,
-        'countries_covered': ree_df['appln_auth'].nunique() if not ree_df.empty else 0,
-        'year_range': f"{ree_df['appln_filing_year'].min()}-{ree_df['appln_filing_year'].max()}" if not ree_df.empty else "N/A"
+        'total_applications': 0,
+        'total_families': 0,
+        'forward_citations': len(forward_citations_df),
+        'backward_citations': len(backward_citations_df),
+        'countries_covered': 0,
+        'year_range': "N/A"
     }
     
+    if not ree_df.empty:
+        # One aggregation pass over only the columns the metrics need
+        stats = ree_df[['docdb_family_id', 'appln_auth', 'appln_filing_year']].agg({
+            'docdb_family_id': 'nunique',
+            'appln_auth': 'nunique',
+            'appln_filing_year': ['min', 'max']
+        })
+        quality_metrics['total_applications'] = len(ree_df)
+        quality_metrics['total_families'] = int(stats.at['nunique', 'docdb_family_id'])
+        quality_metrics['countries_covered'] = int(stats.at['nunique', 'appln_auth'])
+        quality_metrics['year_range'] = f"{int(stats.at['min', 'appln_filing_year'])}-{int(stats.at['max', 'appln_filing_year'])}"
+    
     # Add geographic metrics if available
     if geographic_analysis and 'distribution_analysis' in geographic_analysis:
         geo_dist = geographic_analysis['distribution_analysis']
@@ -61,59 +97,20 @@ def calculate_comprehensive_quality_score(metrics):
     score = 0
     
     # Application count (25 points max)
-    app_count = metrics.get('total_applications', 0)
-    if app_count >= 1000:
-        score += 25
-    elif app_count >= 500:
-        score += 20
-    elif app_count >= 200:
-        score += 15
-    elif app_count >= 100:
-        score += 10
-    elif app_count >= 50:
-        score += 5
+    score += band_points(metrics.get('total_applications', 0), APPLICATION_BANDS)
     
     # Citation coverage (25 points max)
     total_citations = metrics.get('forward_citations', 0) + metrics.get('backward_citations', 0)
-    if total_citations >= 2000:
-        score += 25
-    elif total_citations >= 1000:
-        score += 20
-    elif total_citations >= 500:
-        score += 15
-    elif total_citations >= 200:
-        score += 10
-    elif total_citations >= 50:
-        score += 5
+    score += band_points(total_citations, CITATION_BANDS)
     
     # Geographic diversity (20 points max)
-    countries = metrics.get('countries_covered', 0)
-    if countries >= 20:
-        score += 20
-    elif countries >= 15:
-        score += 15
-    elif countries >= 10:
-        score += 12
-    elif countries >= 5:
-        score += 8
-    elif countries >= 3:
-        score += 5
+    score += band_points(metrics.get('countries_covered', 0), COUNTRY_BANDS)
     
     # Family diversity (15 points max)
     families = metrics.get('total_families', 0)
     applications = metrics.get('total_applications', 1)
     family_ratio = families / applications if applications > 0 else 0
-    
-    if family_ratio >= 0.8:
-        score += 15
-    elif family_ratio >= 0.6:
-        score += 12
-    elif family_ratio >= 0.4:
-        score += 9
-    elif family_ratio >= 0.2:
-        score += 6
-    elif family_ratio > 0:
-        score += 3
+    score += band_points(family_ratio, FAMILY_RATIO_BANDS)
     
     # Market concentration analysis (10 points max)
     concentration = metrics.get('market_concentration_percent', 0)
@@ -127,17 +124,7 @@ def calculate_comprehensive_quality_score(metrics):
         score += 3
     
     # Applicant country diversity (5 points max)
-    applicant_countries = metrics.get('applicant_countries', 0)
-    if applicant_countries >= 15:
-        score += 5
-    elif applicant_countries >= 10:
-        score += 4
-    elif applicant_countries >= 5:
-        score += 3
-    elif applicant_countries >= 3:
-        score += 2
-    elif applicant_countries > 0:
-        score += 1
+    score += band_points(metrics.get('applicant_countries', 0), APPLICANT_COUNTRY_BANDS)
     
     return min(score, 100)
 
@@ -147,22 +134,28 @@ def generate_business_intelligence_summary(ree_df, citation_results, geographic_
     print("\nBUSINESS INTELLIGENCE SUMMARY")
     print("=" * 50)
     
+    # Row counts taken once and reused by every section below
+    total_apps = len(ree_df)
+    forward_cit = len(citation_results.get('forward_citations', [])) if citation_results else 0
+    backward_cit = len(citation_results.get('backward_citations', [])) if citation_results else 0
+    
     # Market overview
-    total_apps = len(ree_df) if not ree_df.empty else 0
     if total_apps > 0:
-        year_min = ree_df['appln_filing_year'].min()
-        year_max = ree_df['appln_filing_year'].max()
+        # Reuse the family count computed during quality validation instead of rescanning
+        total_families = quality_assessment['metrics'].get('total_families')
+        if total_families is None:
+            total_families = ree_df['docdb_family_id'].nunique()
+        filing_years = ree_df['appln_filing_year'].agg(['min', 'max'])
+        year_min = int(filing_years['min'])
+        year_max = int(filing_years['max'])
         
         print(f"📊 MARKET OVERVIEW")
         print(f"   • REE Patent Portfolio: {total_apps:,} applications ({year_min}-{year_max})")
-        print(f"   • Patent Family Coverage: {ree_df['docdb_family_id'].nunique():,} unique families")
+        print(f"   • Patent Family Coverage: {total_families:,} unique families")
         print(f"   • Market Activity Period: {year_max - year_min + 1} years")
     
     # Innovation intelligence
     if citation_results:
-        forward_cit = len(citation_results.get('forward_citations', []))
-        backward_cit = len(citation_results.get('backward_citations', []))
-        
         print(f"\n🔬 INNOVATION INTELLIGENCE")
         print(f"   • Technology Impact: {forward_cit:,} forward citations")
         print(f"   • Knowledge Foundation: {backward_cit:,} backward citations")
@@ -213,7 +206,7 @@ def generate_business_intelligence_summary(ree_df, citation_results, geographic_
     else:
         print(f"   • Market Status: Emerging or niche technology area")
     
-    if citation_results and len(citation_results.get('forward_citations', [])) > 0:
+    if forward_cit > 0:
         print(f"   • Technology Relevance: Active citation network indicates ongoing innovation")
     
     if geographic_results and 'collaboration_analysis' in geographic_results:
@@ -236,54 +229,86 @@ def get_confidence_level(quality_score):
     else:
         return "Low - Requires additional data validation"
 
+def to_json_native(value):
+    """Recursively convert numpy/pandas values into JSON-native Python types
+
+    NaN and infinities become None, so every JSON backend writes them as null.
+    """
+    if isinstance(value, dict):
+        return {str(key): to_json_native(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [to_json_native(item) for item in value]
+    if isinstance(value, (pd.Timestamp, np.datetime64)):
+        return pd.Timestamp(value).isoformat()
+    if isinstance(value, np.generic):
+        value = value.item()
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, (str, int, bool)) or value is None:
+        return value
+    return str(value)
+
+# Rows formatted per to_csv chunk; keeps the writer's string buffers bounded
+CSV_BATCH_ROWS = 65536
+
+def write_dataframe_csv(df, path):
+    """Write a DataFrame export to CSV with pandas' formatting, CSV_BATCH_ROWS rows at a time"""
+    df.to_csv(path, index=False, chunksize=CSV_BATCH_ROWS)
+
+def _maybe_export_csv(df, path, label, export_tasks):
+    """Queue a CSV export task only when the frame has rows"""
+    if df is not None and len(df) > 0:
+        export_tasks.append((path, label, lambda path: write_dataframe_csv(df, path)))
+
 def export_business_data(ree_df, citation_results, geographic_results, quality_assessment, export_prefix="ree_analysis"):
     """Export data in business-friendly formats"""
     
     print(f"\n💾 EXPORTING BUSINESS DATA")
     print("=" * 30)
     
-    exports_created = []
+    # Collect (path, label, writer) tasks; the files are independent so they are written concurrently
+    export_tasks = []
+    n_ree = len(ree_df)
     
-    # Main dataset export
-    if not ree_df.empty:
-        main_export = f"{export_prefix}_patent_dataset.csv"
-        ree_df.to_csv(main_export, index=False)
-        exports_created.append(main_export)
-        print(f"✅ Main Dataset: {main_export}")
-    
-    # Citation data export
+    # Main dataset and citation exports; empty frames are skipped
+    _maybe_export_csv(ree_df, f"{export_prefix}_patent_dataset.csv", "Main Dataset", export_tasks)
     if citation_results:
-        if 'forward_citations' in citation_results and not citation_results['forward_citations'].empty:
-            forward_export = f"{export_prefix}_forward_citations.csv"
-            citation_results['forward_citations'].to_csv(forward_export, index=False)
-            exports_created.append(forward_export)
-            print(f"✅ Forward Citations: {forward_export}")
-        
-        if 'backward_citations' in citation_results and not citation_results['backward_citations'].empty:
-            backward_export = f"{export_prefix}_backward_citations.csv"
-            citation_results['backward_citations'].to_csv(backward_export, index=False)
-            exports_created.append(backward_export)
-            print(f"✅ Backward Citations: {backward_export}")
+        _maybe_export_csv(citation_results.get('forward_citations'), f"{export_prefix}_forward_citations.csv", "Forward Citations", export_tasks)
+        _maybe_export_csv(citation_results.get('backward_citations'), f"{export_prefix}_backward_citations.csv", "Backward Citations", export_tasks)
     
     # Business summary export
-    import json
-    
+    # Values are converted to JSON-native types as they are inserted, so no default= fallback is needed
     business_summary = {
         'analysis_metadata': {
             'export_timestamp': pd.Timestamp.now().isoformat(),
-            'dataset_size': len(ree_df) if not ree_df.empty else 0,
-            'quality_assessment': quality_assessment
+            'dataset_size': n_ree,
+            'quality_assessment': to_json_native(quality_assessment)
         },
-        'geographic_intelligence': geographic_results.get('distribution_analysis', {}) if geographic_results else {},
-        'collaboration_intelligence': geographic_results.get('collaboration_analysis', {}) if geographic_results else {},
-        'citation_intelligence': citation_results.get('citation_patterns', {}) if citation_results else {}
+        'geographic_intelligence': to_json_native(geographic_results.get('distribution_analysis', {})) if geographic_results else {},
+        'collaboration_intelligence': to_json_native(geographic_results.get('collaboration_analysis', {})) if geographic_results else {},
+        'citation_intelligence': to_json_native(citation_results.get('citation_patterns', {})) if citation_results else {}
     }
     
+    def write_summary(path):
+        if orjson is not None:
+            with open(path, 'wb') as f:
+                f.write(orjson.dumps(business_summary, option=orjson.OPT_INDENT_2))
+        else:
+            with open(path, 'w', buffering=1 << 20) as f:
+                json.dump(business_summary, f, indent=2)
+    
     summary_export = f"{export_prefix}_business_summary.json"
-    with open(summary_export, 'w') as f:
-        json.dump(business_summary, f, indent=2, default=str)
-    exports_created.append(summary_export)
-    print(f"✅ Business Summary: {summary_export}")
+    export_tasks.append((summary_export, "Business Summary", write_summary))
+    
+    with ThreadPoolExecutor(max_workers=len(export_tasks)) as executor:
+        futures = [executor.submit(writer, path) for path, _, writer in export_tasks]
+        for future in futures:
+            future.result()
+    
+    exports_created = []
+    for path, label, _ in export_tasks:
+        exports_created.append(path)
+        print(f"✅ {label}: {path}")
     
     print(f"\n📂 Total exports created: {len(exports_created)}")
     return exports_created
@@ -311,21 +336,33 @@ def comprehensive_validation_and_reporting(ree_df, citation_results, geographic_
         'export_files': export_files
     }
 
+def _split_counts(n, shares):
+    """Split n rows by shares, giving any rounding remainder to the last bucket"""
+    counts = (np.asarray(shares) * n).astype(np.int64)
+    counts[-1] += n - counts.sum()
+    return counts
+
+def _make_test_df(n=100):
+    """Build a synthetic REE dataset and matching citations of n rows without Python loops"""
+    ree_df = pd.DataFrame({
+        'appln_id': np.arange(1, n + 1, dtype=np.int32),
+        'docdb_family_id': np.arange(n, 2 * n, dtype=np.int32),
+        'appln_filing_year': np.repeat(np.array([2020, 2021, 2022], dtype=np.int16), _split_counts(n, [0.5, 0.3, 0.2])),
+        'appln_auth': pd.Categorical(np.repeat(['US', 'EP', 'JP', 'CN'], _split_counts(n, [0.4, 0.3, 0.2, 0.1])))
+    })
+    
+    n_citations = n // 2
+    citations_df = pd.DataFrame({
+        'citing_appln_id': np.arange(20 * n + 1, 20 * n + n_citations + 1, dtype=np.int32),
+        'cited_ree_appln_id': np.arange(1, n_citations + 1, dtype=np.int32)
+    })
+    return ree_df, citations_df
+
 if __name__ == "__main__":
     print("Testing Data Validator...")
     
     # Create sample data for testing
-    sample_ree_df = pd.DataFrame({
-        'appln_id': range(1, 101),
-        'docdb_family_id': range(100, 200),
-        'appln_filing_year': [2020] * 50 + [2021] * 30 + [2022] * 20,
-        'appln_auth': ['US'] * 40 + ['EP'] * 30 + ['JP'] * 20 + ['CN'] * 10
-    })
-    
-    sample_citations = pd.DataFrame({
-        'citing_appln_id': range(2001, 2051),
-        'cited_ree_appln_id': range(1, 51)
-    })
+    sample_ree_df, sample_citations = _make_test_df(100)
     
     # Test validation
     results = comprehensive_validation_and_reporting(
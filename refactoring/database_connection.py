@@ -1,38 +1,115 @@
-from epo.tipdata.patstat import PatstatClient
+import os
+import hashlib
+import inspect
+from functools import lru_cache, wraps
+from pathlib import Path
+
+import numpy as np
 import pandas as pd
-from datetime import datetime
+
+ENVIRONMENT = 'PROD'
+CACHE_DIR = Path(os.environ.get('REE_CACHE_DIR', '.ree_cache'))
+
+@lru_cache(maxsize=1)
+def _connect():
+    """Open the PATSTAT ORM session once per process"""
+    from epo.tipdata.patstat import PatstatClient
+
+    patstat = PatstatClient(env=ENVIRONMENT)
+    return patstat.orm()
+
+def format_id_list(ids):
+    """Render integer IDs as a comma-separated SQL IN list, formatting them in C"""
+    return ','.join(np.char.mod('%d', np.asarray(ids, dtype=np.int64)))
+
+def ids_digest(ids):
+    """Short stable hash of an application ID list for cache keys"""
+    joined = format_id_list(np.sort(np.asarray(ids, dtype=np.int64)))
+    return hashlib.sha1(joined.encode()).hexdigest()[:12]
+
+def source_digest(fn):
+    """Short hash of the module source defining fn, so edited queries or filters never reuse old cache files"""
+    try:
+        source = Path(inspect.getsourcefile(fn)).read_bytes()
+    except (OSError, TypeError):
+        # No source file (e.g. defined in a notebook cell): the code's constants still carry the SQL text
+        source = repr(fn.__code__.co_consts).encode()
+    return hashlib.sha1(source).hexdigest()[:8]
+
+def disk_cache(key_fn):
+    """Memoize a DataFrame-returning PATSTAT fetch as Parquet under CACHE_DIR
+
+    Cache files are keyed on key_fn plus the fetch module's source digest.
+    Set REE_CACHE_DISABLE=1 to always query the database.
+    Cache messages go to the log keyword (print by default), which is also
+    passed on to fetches that take a log parameter.
+    """
+    def decorator(fn):
+        version = source_digest(fn)
+        takes_log = 'log' in inspect.signature(fn).parameters
+        
+        @wraps(fn)
+        def wrapper(*args, log=print, **kwargs):
+            fetch_kwargs = {**kwargs, 'log': log} if takes_log else kwargs
+            if os.environ.get('REE_CACHE_DISABLE') == '1':
+                return fn(*args, **fetch_kwargs)
+            
+            path = CACHE_DIR / f"{key_fn(*args, **kwargs)}_{version}_{ENVIRONMENT}.parquet"
+            if path.exists():
+                log(f"📦 Loaded cached {fn.__name__} from {path}")
+                return pd.read_parquet(path)
+            
+            df = fn(*args, **fetch_kwargs)
+            if not df.empty:
+                try:
+                    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+                    df.to_parquet(path, index=False)
+                except Exception as e:
+                    log(f"⚠️ Could not cache {fn.__name__}: {e}")
+            return df
+        return wrapper
+    return decorator
+
+def smoke_test(db):
+    """Run a small 2010-2023 sample query against an open connection"""
+    test_query = """
+    SELECT appln_id, appln_auth, appln_filing_year
+    FROM tls201_appln
+    WHERE appln_filing_year BETWEEN 2010 AND 2023
+    LIMIT 10
+    """
+
+    test_result = pd.read_sql(test_query, db.bind)
+    print(f"✅ Retrieved {len(test_result)} sample records")
+    print(f"   Year range: {test_result['appln_filing_year'].min()}-{test_result['appln_filing_year'].max()}")
+    print(f"   Countries: {test_result['appln_auth'].unique()}")
 
 def test_tip_connection():
     """Connect to PROD environment with 2010-2023 timeframe"""
-    environment = 'PROD'
-    print(f"Connecting to PATSTAT {environment} environment...")
-    
+    print(f"Connecting to PATSTAT {ENVIRONMENT} environment...")
+
     try:
-        patstat = PatstatClient(env=environment)
-        db = patstat.orm()
-        
-        # Test with comprehensive timeframe
-        test_query = """
-        SELECT appln_id, appln_auth, appln_filing_year 
-        FROM tls201_appln 
-        WHERE appln_filing_year BETWEEN 2010 AND 2023
-        LIMIT 10
-        """
-        
-        test_result = pd.read_sql(test_query, db.bind)
-        print(f"✅ Retrieved {len(test_result)} sample records")
-        print(f"   Year range: {test_result['appln_filing_year'].min()}-{test_result['appln_filing_year'].max()}")
-        print(f"   Countries: {test_result['appln_auth'].unique()}")
-        
+        db = _connect()
+        smoke_test(db)
         return db
-        
+
     except Exception as e:
         print(f"❌ Connection failed: {e}")
         return None
 
 def get_patstat_connection():
-    """Get production PATSTAT database connection"""
-    return test_tip_connection()
+    """Get production PATSTAT database connection
+
+    Reuses the cached session; set PATSTAT_SMOKE_TEST=1 to also run the sample query.
+    """
+    if os.environ.get('PATSTAT_SMOKE_TEST') == '1':
+        return test_tip_connection()
+
+    try:
+        return _connect()
+    except Exception as e:
+        print(f"❌ Connection failed: {e}")
+        return None
 
 if __name__ == "__main__":
     print("Testing PATSTAT TIP Connection...")
@@ -40,4 +117,4 @@ if __name__ == "__main__":
     if db:
         print("✅ Database connection successful!")
     else:
-        print("❌ Database connection failed!")
\ No newline at end of file
+        print("❌ Database connection failed!")
@@ -1,6 +1,22 @@
 import pandas as pd
-from database_connection import get_patstat_connection
+from database_connection import get_patstat_connection, disk_cache
 
+# Explicit dtypes applied once at ingest so downstream nunique/min/max skip inference
+INGEST_DTYPES = {
+    'appln_filing_year': 'int16',
+    'appln_auth': 'category',
+    'cpc_class_symbol': 'category',
+    'search_method': 'category'
+}
+
+def apply_ingest_dtypes(df):
+    """Cast known REE dataset columns to compact dtypes in place, leaving other columns uncopied"""
+    for col, dtype in INGEST_DTYPES.items():
+        if col in df.columns:
+            df[col] = df[col].astype(dtype)
+    return df
+
+@disk_cache(key_fn=lambda db, test_mode=True: f'ree_dataset_{test_mode}')
 def build_ree_dataset(db, test_mode=True):
     """Build REE dataset with combined keyword and classification search"""
     
@@ -96,13 +112,13 @@ def build_ree_dataset(db, test_mode=True):
         print(f"Search method distribution:")
         print(combined_df['search_method'].value_counts())
         
-        return combined_df
+        return apply_ingest_dtypes(combined_df)
     elif not keyword_results.empty:
         keyword_results['search_method'] = 'keyword_only'
-        return keyword_results
+        return apply_ingest_dtypes(keyword_results)
     elif not classification_results.empty:
         classification_results['search_method'] = 'cpc_only'
-        return classification_results
+        return apply_ingest_dtypes(classification_results)
     else:
         print("❌ No REE patents found")
         return pd.DataFrame()
@@ -1,12 +1,8 @@
 import pandas as pd
-import numpy as np
 import plotly.graph_objects as go
-import plotly.express as px
 from plotly.subplots import make_subplots
-import plotly.figure_factory as ff
 from datetime import datetime
 from typing import Dict, List, Tuple, Optional
-import json
 
 # Import all our modules
 from integrated_market_pipeline import IntegratedMarketPipeline
@@ -36,6 +32,10 @@ class EnhancedREEDashboard:
             'geographic': '#8c564b'
         }
         
+        # Aggregations shared by every dashboard built from the same patent dataset
+        self._patent_series_source = None
+        self._patent_series = {}
+        
     def create_integrated_executive_dashboard(self, integrated_results: Optional[Dict] = None) -> go.Figure:
         """
         Create comprehensive 4-panel executive dashboard
@@ -57,6 +57,7 @@ class EnhancedREEDashboard:
         patent_data = integrated_results['patent_analytics']['ree_dataset']
         correlation_data = integrated_results['correlation_analysis']
         market_data = integrated_results['market_intelligence']['market_data']
+        patent_series = self._get_patent_series(patent_data)
         
         # Create 2x2 subplot layout
         fig = make_subplots(
@@ -76,13 +77,13 @@ class EnhancedREEDashboard:
         )
         
         # Panel 1: Patent Trends vs Price Volatility
-        self._add_patent_price_correlation_panel(fig, patent_data, market_data, row=1, col=1)
+        self._add_patent_price_correlation_panel(fig, patent_series, market_data, row=1, col=1)
         
         # Panel 2: Geographic Innovation vs Supply Risk
-        self._add_geographic_supply_risk_panel(fig, patent_data, correlation_data, row=1, col=2)
+        self._add_geographic_supply_risk_panel(fig, patent_series, correlation_data, row=1, col=2)
         
         # Panel 3: Market Event Impact Analysis
-        self._add_market_event_impact_panel(fig, patent_data, correlation_data, row=2, col=1)
+        self._add_market_event_impact_panel(fig, patent_series, correlation_data, row=2, col=1)
         
         # Panel 4: Business Value Analysis
         self._add_business_value_panel(fig, integrated_results, row=2, col=2)
@@ -110,11 +111,20 @@ class EnhancedREEDashboard:
         print("✅ Integrated executive dashboard created")
         return fig
     
-    def _add_patent_price_correlation_panel(self, fig, patent_data, market_data, row, col):
+    def _get_patent_series(self, patent_data: pd.DataFrame) -> Dict[str, pd.Series]:
+        """Count filings per country and per year once per dataset; all panels read these Series"""
+        if self._patent_series_source is not patent_data:
+            self._patent_series = {
+                'top_countries': patent_data['appln_auth'].value_counts().head(10),
+                'yearly_filings': patent_data['appln_filing_year'].value_counts().sort_index()
+            }
+            self._patent_series_source = patent_data
+        return self._patent_series
+    
+    def _add_patent_price_correlation_panel(self, fig, patent_series, market_data, row, col):
         """Add patent filing trends vs price volatility panel"""
         # Patent filings by year
-        patent_by_year = patent_data.groupby('appln_filing_year').size().reset_index()
-        patent_by_year.columns = ['year', 'patent_filings']
+        patent_by_year = patent_series['yearly_filings'].rename_axis('year').reset_index(name='patent_filings')
         
         # Market price data
         price_trends = market_data['price_trends']['neodymium_price_index']
@@ -174,10 +184,10 @@ class EnhancedREEDashboard:
                     row=row, col=col
                 )
     
-    def _add_geographic_supply_risk_panel(self, fig, patent_data, correlation_data, row, col):
+    def _add_geographic_supply_risk_panel(self, fig, patent_series, correlation_data, row, col):
         """Add geographic innovation vs supply chain risk panel"""
         # Top patent countries
-        top_countries = patent_data['appln_auth'].value_counts().head(10)
+        top_countries = patent_series['top_countries']
         
         # Country codes for proper mapping
         country_mapping = {
@@ -228,7 +238,7 @@ class EnhancedREEDashboard:
             row=row, col=col
         )
     
-    def _add_market_event_impact_panel(self, fig, patent_data, correlation_data, row, col):
+    def _add_market_event_impact_panel(self, fig, patent_series, correlation_data, row, col):
         """Add market event impact analysis panel"""
         # Market events timeline
         market_events = correlation_data.get('market_event_analysis', {}).get('major_events_analysis', [])
@@ -248,6 +258,10 @@ class EnhancedREEDashboard:
         response_patents = []
         event_labels = []
         
+        # Each event window sums a handful of precomputed yearly totals
+        filings_by_year = patent_series['yearly_filings']
+        filing_years = filings_by_year.index
+        
         for event in market_events:
             period = event['period']
             start_year = int(period.split('-')[0])
@@ -255,19 +269,13 @@ class EnhancedREEDashboard:
             event_labels.append(event['event'][:30] + '...' if len(event['event']) > 30 else event['event'])
             
             # Calculate baseline (2 years before)
-            baseline_data = patent_data[
-                (patent_data['appln_filing_year'] >= start_year-2) & 
-                (patent_data['appln_filing_year'] < start_year)
-            ]
-            baseline_avg = len(baseline_data) / 2 if len(baseline_data) > 0 else 50
+            baseline_count = int(filings_by_year[(filing_years >= start_year-2) & (filing_years < start_year)].sum())
+            baseline_avg = baseline_count / 2 if baseline_count > 0 else 50
             baseline_patents.append(baseline_avg)
             
             # Calculate response (2 years after)
-            response_data = patent_data[
-                (patent_data['appln_filing_year'] >= start_year) & 
-                (patent_data['appln_filing_year'] <= start_year+2)
-            ]
-            response_avg = len(response_data) / 3 if len(response_data) > 0 else 60
+            response_count = int(filings_by_year[(filing_years >= start_year) & (filing_years <= start_year+2)].sum())
+            response_avg = response_count / 3 if response_count > 0 else 60
             response_patents.append(response_avg)
         
         # Baseline vs Response comparison
@@ -392,7 +400,7 @@ class EnhancedREEDashboard:
         # Panel 2: Patent innovation vs supply risk scatter
         if integrated_results.get('patent_analytics', {}).get('ree_dataset') is not None:
             patent_data = integrated_results['patent_analytics']['ree_dataset']
-            country_patents = patent_data['appln_auth'].value_counts().head(10)
+            country_patents = self._get_patent_series(patent_data)['top_countries']
             
             risk_levels = {
                 'CN': 95, 'US': 25, 'JP': 30, 'DE': 35, 'KR': 40,
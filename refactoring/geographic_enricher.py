@@ -1,19 +1,62 @@
+from concurrent.futures import ThreadPoolExecutor
+
 import pandas as pd
-from database_connection import get_patstat_connection
+from sqlalchemy import bindparam, text
+from database_connection import get_patstat_connection, disk_cache, ids_digest
 
-def enrich_with_geographic_data(db, ree_df):
-    """Add comprehensive country information"""
-    
-    if ree_df.empty:
-        print("❌ Empty REE dataset provided")
-        return ree_df
-    
-    appln_ids_str = ','.join(map(str, ree_df['appln_id']))
-    
-    print("🌍 Enriching with geographic data...")
+# Applicant rows are fetched in bounded chunks and narrowed before they are combined
+GEO_CHUNK_ROWS = 50_000
+GEO_NUMERIC_DTYPES = {'appln_id': 'int64', 'applt_seq_nr': 'int32'}
+GEO_CATEGORY_COLUMNS = ('person_ctry_code', 'country_name')
+
+# Regional groupings (based on common patent analytics), built once at import
+REGION_BY_COUNTRY = pd.Series({
+    'US': 'North America',
+    'CA': 'North America',
+    'MX': 'North America',
+    'JP': 'Asia Pacific',
+    'CN': 'Asia Pacific', 
+    'KR': 'Asia Pacific',
+    'IN': 'Asia Pacific',
+    'AU': 'Asia Pacific',
+    'SG': 'Asia Pacific',
+    'TW': 'Asia Pacific',
+    'DE': 'Europe',
+    'GB': 'Europe',
+    'FR': 'Europe',
+    'IT': 'Europe',
+    'NL': 'Europe',
+    'SE': 'Europe',
+    'CH': 'Europe',
+    'DK': 'Europe',
+    'FI': 'Europe',
+    'NO': 'Europe',
+    'AT': 'Europe',
+    'BE': 'Europe',
+    'ES': 'Europe',
+    'PT': 'Europe',
+    'IE': 'Europe',
+    'LU': 'Europe',
+    'BR': 'Latin America',
+    'AR': 'Latin America',
+    'CL': 'Latin America',
+    'CO': 'Latin America',
+    'PE': 'Latin America',
+    'RU': 'Eurasia',
+    'TR': 'Eurasia',
+    'IL': 'Middle East & Africa',
+    'ZA': 'Middle East & Africa',
+    'EG': 'Middle East & Africa',
+    'SA': 'Middle East & Africa',
+    'AE': 'Middle East & Africa'
+})
+
+@disk_cache(key_fn=lambda db, appln_ids: f'geo_applicants_{ids_digest(appln_ids)}')
+def fetch_applicant_countries(db, appln_ids):
+    """Query applicant countries for a list of applications"""
     
-    # Get applicant country information
-    geo_query = f"""
+    # The ID list is bound as an expanding parameter
+    geo_query = text("""
     SELECT DISTINCT
         pa.appln_id,
         p.person_ctry_code,
@@ -22,92 +65,129 @@ def enrich_with_geographic_data(db, ree_df):
     FROM tls207_pers_appln pa
     JOIN tls206_person p ON pa.person_id = p.person_id
     JOIN tls801_country c ON p.person_ctry_code = c.ctry_code
-    WHERE pa.appln_id IN ({appln_ids_str})
+    WHERE pa.appln_id IN :ids
     AND pa.applt_seq_nr > 0
     ORDER BY pa.appln_id, pa.applt_seq_nr
-    """
+    """).bindparams(bindparam('ids', expanding=True))
+    
+    chunks = [
+        chunk.astype(GEO_NUMERIC_DTYPES)
+        for chunk in pd.read_sql(geo_query, db.bind, params={'ids': list(appln_ids)}, chunksize=GEO_CHUNK_ROWS)
+    ]
+    if not chunks:
+        return pd.DataFrame()
+    
+    geo_data = pd.concat(chunks, ignore_index=True)
+    # Categories are assigned after concat so every chunk shares one dictionary
+    for col in GEO_CATEGORY_COLUMNS:
+        geo_data[col] = geo_data[col].astype('category')
+    return geo_data
+
+@disk_cache(key_fn=lambda db, appln_ids, limit=5: f'geo_collaboration_summary_{limit}_{ids_digest(appln_ids)}')
+def fetch_collaboration_summary(db, appln_ids, limit=5):
+    """Summarise multi-country applications and their top two-country pairs server-side"""
+    
+    # One row per top pair, each carrying the overall totals; the LEFT JOIN keeps
+    # the totals row even when there are no bilateral pairs
+    summary_query = text("""
+    WITH app_countries AS (
+        SELECT DISTINCT pa.appln_id, p.person_ctry_code AS ctry
+        FROM tls207_pers_appln pa
+        JOIN tls206_person p ON pa.person_id = p.person_id
+        WHERE pa.appln_id IN :ids
+        AND pa.applt_seq_nr > 0
+    ),
+    collaborations AS (
+        SELECT appln_id, COUNT(DISTINCT ctry) AS country_count, MIN(ctry) AS country_a, MAX(ctry) AS country_b
+        FROM app_countries
+        GROUP BY appln_id
+        HAVING COUNT(DISTINCT ctry) > 1
+    ),
+    totals AS (
+        SELECT
+            COUNT(*) AS total_collaborations,
+            CAST(AVG(country_count) AS DOUBLE PRECISION) AS average_countries,
+            MAX(country_count) AS max_countries
+        FROM collaborations
+    ),
+    top_pairs AS (
+        SELECT country_a, country_b, COUNT(*) AS collaborations
+        FROM collaborations
+        WHERE country_count = 2
+        GROUP BY country_a, country_b
+        ORDER BY collaborations DESC, country_a, country_b
+        LIMIT :limit
+    )
+    SELECT t.total_collaborations, t.average_countries, t.max_countries,
+           tp.country_a, tp.country_b, tp.collaborations
+    FROM totals t
+    LEFT JOIN top_pairs tp ON TRUE
+    ORDER BY tp.collaborations DESC, tp.country_a, tp.country_b
+    """).bindparams(bindparam('ids', expanding=True))
+    
+    return pd.read_sql(summary_query, db.bind, params={'ids': list(appln_ids), 'limit': limit})
+
+def enrich_with_geographic_data(db, ree_df, log=print):
+    """Add comprehensive country information"""
+    
+    if ree_df.empty:
+        log("❌ Empty REE dataset provided")
+        return ree_df
+    
+    log("🌍 Enriching with geographic data...")
     
-    geo_data = pd.read_sql(geo_query, db.bind)
+    # Get applicant country information (cached on disk per appln_id set)
+    geo_data = fetch_applicant_countries(db, ree_df['appln_id'].tolist(), log=log)
     
     if not geo_data.empty:
-        print(f"✅ Geographic data: {geo_data['person_ctry_code'].nunique()} countries")
+        log(f"✅ Geographic data: {geo_data['person_ctry_code'].nunique()} countries")
         country_counts = geo_data['person_ctry_code'].value_counts()
-        print(f"Top Countries: {country_counts.head(5).to_dict()}")
+        log(f"Top Countries: {country_counts.head(5).to_dict()}")
         
         # Get primary applicant country (first applicant)
-        primary_applicants = geo_data[geo_data['applt_seq_nr'] == 1][['appln_id', 'person_ctry_code', 'country_name']].copy()
+        # Project to the merge columns while filtering so the merge never sees applt_seq_nr
+        primary_applicants = geo_data.loc[geo_data['applt_seq_nr'] == 1, ['appln_id', 'person_ctry_code', 'country_name']]
         primary_applicants.columns = ['appln_id', 'primary_applicant_country', 'primary_applicant_country_name']
         
-        # Merge with original dataset
-        enriched_df = ree_df.merge(primary_applicants, on='appln_id', how='left')
+        # Join on the appln_id index (already sorted by the query's ORDER BY) instead of a hash merge
+        enriched_df = ree_df.join(primary_applicants.set_index('appln_id'), on='appln_id', how='left').reset_index(drop=True)
         
-        print(f"Primary applicant countries: {enriched_df['primary_applicant_country'].nunique()}")
+        log(f"Primary applicant countries: {enriched_df['primary_applicant_country'].nunique()}")
         
         return enriched_df
     else:
-        print("❌ No geographic data found")
+        log("❌ No geographic data found")
         return ree_df
 
+def save_enriched(enriched_df, path):
+    """Persist an enriched dataset as zstd Feather so other notebooks can reload it"""
+    import pyarrow.feather as feather
+    
+    feather.write_feather(enriched_df, path, compression='zstd')
+    print(f"💾 Saved {len(enriched_df):,} enriched records to {path}")
+
+def load_enriched(path):
+    """Reload an enriched dataset saved by save_enriched; categoricals survive the round trip"""
+    import pyarrow.feather as feather
+    
+    return feather.read_feather(path, memory_map=True)
+
 def get_geographic_distribution(enriched_df):
     """Analyze geographic distribution patterns"""
     
     if enriched_df.empty or 'primary_applicant_country' not in enriched_df.columns:
         return {}
     
-    # Country distribution analysis
-    country_dist = enriched_df['primary_applicant_country'].value_counts()
-    
-    # Regional groupings (based on common patent analytics)
-    regional_mapping = {
-        'US': 'North America',
-        'CA': 'North America',
-        'MX': 'North America',
-        'JP': 'Asia Pacific',
-        'CN': 'Asia Pacific', 
-        'KR': 'Asia Pacific',
-        'IN': 'Asia Pacific',
-        'AU': 'Asia Pacific',
-        'SG': 'Asia Pacific',
-        'TW': 'Asia Pacific',
-        'DE': 'Europe',
-        'GB': 'Europe',
-        'FR': 'Europe',
-        'IT': 'Europe',
-        'NL': 'Europe',
-        'SE': 'Europe',
-        'CH': 'Europe',
-        'DK': 'Europe',
-        'FI': 'Europe',
-        'NO': 'Europe',
-        'AT': 'Europe',
-        'BE': 'Europe',
-        'ES': 'Europe',
-        'PT': 'Europe',
-        'IE': 'Europe',
-        'LU': 'Europe',
-        'BR': 'Latin America',
-        'AR': 'Latin America',
-        'CL': 'Latin America',
-        'CO': 'Latin America',
-        'PE': 'Latin America',
-        'RU': 'Eurasia',
-        'TR': 'Eurasia',
-        'IL': 'Middle East & Africa',
-        'ZA': 'Middle East & Africa',
-        'EG': 'Middle East & Africa',
-        'SA': 'Middle East & Africa',
-        'AE': 'Middle East & Africa'
-    }
-    
-    # Add regional classification
-    enriched_df_copy = enriched_df.copy()
-    enriched_df_copy['region'] = enriched_df_copy['primary_applicant_country'].map(regional_mapping)
-    enriched_df_copy['region'] = enriched_df_copy['region'].fillna('Other')
+    # Country distribution analysis: the only scan of the enriched frame
+    # (missing countries are kept here so they still count towards the 'Other' region)
+    country_counts = enriched_df['primary_applicant_country'].value_counts(dropna=False)
+    # Categorical columns also report categories with no primary applicants; keep observed ones only
+    country_counts = country_counts[country_counts > 0]
+    country_dist = country_counts[country_counts.index.notna()]
     
-    regional_dist = enriched_df_copy['region'].value_counts()
-    
-    # Time-based geographic trends
-    yearly_country_trends = enriched_df_copy.groupby(['appln_filing_year', 'primary_applicant_country']).size().unstack(fill_value=0)
+    # Regional totals roll up the per-country counts instead of rescanning the rows
+    region = country_counts.index.map(REGION_BY_COUNTRY).fillna('Other')
+    regional_dist = country_counts.groupby(region).sum().sort_values(ascending=False, kind='stable')
     
     # Market concentration analysis
     top_5_countries = country_dist.head(5)
@@ -128,57 +208,38 @@ def get_geographic_distribution(enriched_df):
     
     return geographic_analysis
 
-def analyze_geographic_collaboration(db, ree_df):
+def analyze_geographic_collaboration(db, ree_df, log=print):
     """Analyze international collaboration patterns"""
     
     if ree_df.empty:
         return {}
     
-    appln_ids_str = ','.join(map(str, ree_df['appln_id']))
-    
-    # Multi-country applications (international collaboration)
-    collaboration_query = f"""
-    SELECT 
-        pa.appln_id,
-        COUNT(DISTINCT p.person_ctry_code) as country_count,
-        STRING_AGG(DISTINCT p.person_ctry_code, ',') as collaborating_countries
-    FROM tls207_pers_appln pa
-    JOIN tls206_person p ON pa.person_id = p.person_id
-    WHERE pa.appln_id IN ({appln_ids_str})
-    AND pa.applt_seq_nr > 0
-    GROUP BY pa.appln_id
-    HAVING COUNT(DISTINCT p.person_ctry_code) > 1
-    """
-    
-    print("🤝 Analyzing international collaboration...")
-    collaboration_data = pd.read_sql(collaboration_query, db.bind)
+    # Multi-country totals and top pairs come back in one aggregated query, cached on disk per appln_id set
+    log("🤝 Analyzing international collaboration...")
+    collaboration_summary = fetch_collaboration_summary(db, ree_df['appln_id'].tolist(), log=log)
+    total_collaborations = int(collaboration_summary['total_collaborations'].iloc[0]) if not collaboration_summary.empty else 0
     
     collaboration_analysis = {}
     
-    if not collaboration_data.empty:
-        print(f"✅ Found {len(collaboration_data)} international collaborations")
+    if total_collaborations:
+        log(f"✅ Found {total_collaborations} international collaborations")
         
+        totals = collaboration_summary.iloc[0]
         collaboration_analysis = {
-            'total_collaborations': len(collaboration_data),
-            'collaboration_rate_percent': round((len(collaboration_data) / len(ree_df)) * 100, 2),
-            'average_countries_per_collaboration': round(collaboration_data['country_count'].mean(), 2),
-            'max_countries_in_collaboration': collaboration_data['country_count'].max()
+            'total_collaborations': total_collaborations,
+            'collaboration_rate_percent': round((total_collaborations / len(ree_df)) * 100, 2),
+            'average_countries_per_collaboration': round(float(totals['average_countries']), 2),
+            'max_countries_in_collaboration': int(totals['max_countries'])
         }
         
-        # Most common collaboration patterns
-        country_pair_analysis = {}
-        for _, row in collaboration_data.iterrows():
-            countries = sorted(row['collaborating_countries'].split(','))
-            if len(countries) == 2:
-                pair = f"{countries[0]}-{countries[1]}"
-                country_pair_analysis[pair] = country_pair_analysis.get(pair, 0) + 1
+        # Most common collaboration patterns, counted in SQL so only the top pairs come back
+        top_pairs = collaboration_summary.dropna(subset=['country_a'])
         
-        if country_pair_analysis:
-            collaboration_analysis['top_bilateral_collaborations'] = dict(
-                sorted(country_pair_analysis.items(), key=lambda x: x[1], reverse=True)[:5]
-            )
+        if not top_pairs.empty:
+            pair_labels = top_pairs['country_a'] + '-' + top_pairs['country_b']
+            collaboration_analysis['top_bilateral_collaborations'] = dict(zip(pair_labels, top_pairs['collaborations'].astype(int).tolist()))
     else:
-        print("❌ No international collaborations found")
+        log("❌ No international collaborations found")
         collaboration_analysis = {
             'total_collaborations': 0,
             'collaboration_rate_percent': 0
@@ -197,28 +258,43 @@ def get_comprehensive_geographic_intelligence(ree_df, test_mode=True):
         print("❌ Database connection failed")
         return None
     
-    # Step 1: Enrich with geographic data
-    print("\n🌍 GEOGRAPHIC ENRICHMENT")
-    print("-" * 25)
-    enriched_df = enrich_with_geographic_data(db, ree_df)
-    
-    # Step 2: Analyze distribution patterns
-    print("\n📊 DISTRIBUTION ANALYSIS")
-    print("-" * 25)
-    distribution_analysis = get_geographic_distribution(enriched_df)
-    
-    for category, data in distribution_analysis.items():
-        print(f"\n{category.replace('_', ' ').title()}:")
-        if isinstance(data, dict):
-            for key, value in data.items():
-                print(f"  {key}: {value}")
-        else:
-            print(f"  {data}")
-    
-    # Step 3: Analyze collaboration patterns
-    print("\n🤝 COLLABORATION ANALYSIS")
-    print("-" * 25)
-    collaboration_analysis = analyze_geographic_collaboration(db, ree_df)
+    # Enrichment and collaboration queries are independent, so both go to PATSTAT
+    # at once; distribution analysis starts as soon as enrichment returns.
+    # Each worker logs into its own list, printed under its section header
+    enrich_log, collaboration_log = [], []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        # Step 1: Enrich with geographic data
+        print("\n🌍 GEOGRAPHIC ENRICHMENT")
+        print("-" * 25)
+        enrich_future = executor.submit(enrich_with_geographic_data, db, ree_df, log=enrich_log.append)
+        collaboration_future = executor.submit(analyze_geographic_collaboration, db, ree_df, log=collaboration_log.append)
+        try:
+            enriched_df = enrich_future.result()
+        finally:
+            for line in enrich_log:
+                print(line)
+        
+        # Step 2: Analyze distribution patterns
+        print("\n📊 DISTRIBUTION ANALYSIS")
+        print("-" * 25)
+        distribution_analysis = get_geographic_distribution(enriched_df)
+        
+        for category, data in distribution_analysis.items():
+            print(f"\n{category.replace('_', ' ').title()}:")
+            if isinstance(data, dict):
+                for key, value in data.items():
+                    print(f"  {key}: {value}")
+            else:
+                print(f"  {data}")
+        
+        # Step 3: Analyze collaboration patterns
+        print("\n🤝 COLLABORATION ANALYSIS")
+        print("-" * 25)
+        try:
+            collaboration_analysis = collaboration_future.result()
+        finally:
+            for line in collaboration_log:
+                print(line)
     
     for metric, value in collaboration_analysis.items():
         print(f"  {metric.replace('_', ' ').title()}: {value}")
@@ -5,12 +5,17 @@ from typing import Dict, List, Tuple, Optional
 import json
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Import existing patent analytics modules
 from database_connection import test_tip_connection
 from dataset_builder import build_ree_dataset
 from citation_analyzer import analyze_citations_for_ree_dataset
 from geographic_enricher import get_comprehensive_geographic_intelligence
-from data_validator import comprehensive_validation_and_reporting
+from data_validator import comprehensive_validation_and_reporting, to_json_native
 
 # Import new market intelligence modules
 from usgs_market_collector import USGSMineralDataCollector
@@ -177,7 +182,7 @@ class IntegratedMarketPipeline:
             
             # Step 3: Citation analysis
             print("📊 Analyzing patent citations...")
-            appln_ids = ree_data['appln_id'].tolist()
+            appln_ids = ree_data['appln_id'].to_numpy(dtype=np.int64)
             citation_results = analyze_citations_for_ree_dataset(appln_ids, test_mode)
             
             # Step 4: Geographic intelligence
@@ -444,8 +449,14 @@ class IntegratedMarketPipeline:
                 'pipeline_summary': self.pipeline_summary
             }
             
-            with open(main_results_file, 'w') as f:
-                json.dump(main_results, f, indent=2, default=str)
+            # Normalize numpy/pandas values in one pass so the encoder needs no default= callback
+            main_results = to_json_native(main_results)
+            if orjson is not None:
+                with open(main_results_file, 'wb') as f:
+                    f.write(orjson.dumps(main_results, option=orjson.OPT_INDENT_2))
+            else:
+                with open(main_results_file, 'w', buffering=1 << 20) as f:
+                    json.dump(main_results, f, indent=2)
             export_files.append(main_results_file)
             
             # Export executive summary as CSV
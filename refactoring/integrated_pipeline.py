@@ -1,3 +1,4 @@
+import numpy as np
 from database_connection import test_tip_connection
 from dataset_builder import build_ree_dataset
 from citation_analyzer import analyze_citations_for_ree_dataset
@@ -35,7 +36,7 @@ def run_complete_ree_analysis(test_mode=True):
     # Step 3: Citation analysis
     print("\n📊 STEP 3: CITATION INTELLIGENCE")
     print("-" * 30)
-    appln_ids = ree_data['appln_id'].tolist()
+    appln_ids = ree_data['appln_id'].to_numpy(dtype=np.int64)
     citation_results = analyze_citations_for_ree_dataset(appln_ids, test_mode)
     
     if citation_results:
@@ -45,6 +46,7 @@ def run_complete_ree_analysis(test_mode=True):
     else:
         print("⚠️ Citation analysis completed with limited results")
         citation_results = {}
+        forward_count = backward_count = 0
     
     # Step 4: Geographic intelligence
     print("\n🌍 STEP 4: GEOGRAPHIC INTELLIGENCE")
@@ -73,23 +75,26 @@ def run_complete_ree_analysis(test_mode=True):
     print("🎉 PIPELINE EXECUTION COMPLETE")
     print("=" * 50)
     
-    total_citations = 0
-    if citation_results:
-        forward_cit = len(citation_results.get('forward_citations', []))
-        backward_cit = len(citation_results.get('backward_citations', []))
-        total_citations = forward_cit + backward_cit
-    
-    print(f"📊 Final Results Summary:")
-    print(f"   • REE Patents Analyzed: {len(enriched_data):,}")
-    print(f"   • Patent Families: {enriched_data['docdb_family_id'].nunique():,}")
-    print(f"   • Total Citations: {total_citations:,}")
-    print(f"   • Countries Covered: {enriched_data['appln_auth'].nunique()}")
-    print(f"   • Quality Score: {validation_results['quality_assessment']['quality_score']}/100")
-    print(f"   • Export Files: {len(validation_results['export_files'])}")
-    
-    quality_rating = validation_results['quality_assessment']['quality_rating']
-    print(f"\n🏆 Analysis Quality: {quality_rating}")
-    print(f"💼 Business Value: Ready for executive presentation")
+    # Citation counts come from step 3; count applications, families and countries once
+    total_citations = forward_count + backward_count
+    total_applications = len(enriched_data)
+    total_families = enriched_data['docdb_family_id'].nunique()
+    countries_covered = enriched_data['appln_auth'].nunique()
+    quality_assessment = validation_results['quality_assessment']
+    quality_score = quality_assessment['quality_score']
+    quality_rating = quality_assessment['quality_rating']
+    
+    print(
+        f"📊 Final Results Summary:\n"
+        f"   • REE Patents Analyzed: {total_applications:,}\n"
+        f"   • Patent Families: {total_families:,}\n"
+        f"   • Total Citations: {total_citations:,}\n"
+        f"   • Countries Covered: {countries_covered}\n"
+        f"   • Quality Score: {quality_score}/100\n"
+        f"   • Export Files: {len(validation_results['export_files'])}\n"
+        f"\n🏆 Analysis Quality: {quality_rating}\n"
+        f"💼 Business Value: Ready for executive presentation"
+    )
     
     return {
         'ree_dataset': enriched_data,
@@ -97,11 +102,11 @@ def run_complete_ree_analysis(test_mode=True):
         'geographic_results': geographic_results,
         'validation_results': validation_results,
         'pipeline_summary': {
-            'total_applications': len(enriched_data),
-            'total_families': enriched_data['docdb_family_id'].nunique(),
+            'total_applications': total_applications,
+            'total_families': total_families,
             'total_citations': total_citations,
-            'countries_covered': enriched_data['appln_auth'].nunique(),
-            'quality_score': validation_results['quality_assessment']['quality_score'],
+            'countries_covered': countries_covered,
+            'quality_score': quality_score,
             'quality_rating': quality_rating
         }
     }
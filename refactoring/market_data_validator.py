@@ -1,10 +1,28 @@
-import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from bisect import bisect_right
+from datetime import datetime, timezone
 from typing import Dict, List, Tuple, Optional
+import copy
+import hashlib
 import json
-import os
-from usgs_market_collector import USGSMineralDataCollector
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Quality rating bands: (ascending score thresholds, rating for each band)
+QUALITY_RATING_BANDS = ((60, 70, 80, 90), ('INADEQUATE', 'NEEDS_IMPROVEMENT', 'ACCEPTABLE', 'GOOD', 'EXCELLENT'))
+
+@lru_cache(maxsize=128)
+def _rating_for(score):
+    """Memoized band lookup; quality scores are small integers"""
+    thresholds, ratings = QUALITY_RATING_BANDS
+    return ratings[bisect_right(thresholds, score)]
 
 class MarketDataValidator:
     """
@@ -12,20 +30,47 @@ class MarketDataValidator:
     Ensures data integrity and business-grade reliability for consulting services
     """
     
+    __slots__ = (
+        'usgs_collector',
+        '_min_years', '_min_commodities', '_volatility_threshold', '_freshness_days', '_min_quality_score',
+        'validation_results', 'critical_issues', 'warnings',
+        '_cache', '_last_fingerprint', '_last_steps'
+    )
+    
     def __init__(self):
+        # Imported here so loading this module does not pull in the collector
+        from usgs_market_collector import USGSMineralDataCollector
+        
         self.usgs_collector = USGSMineralDataCollector()
-        self.validation_thresholds = {
-            'minimum_years_coverage': 10,
-            'minimum_commodities': 5,
-            'price_volatility_threshold': 100,  # % change considered high volatility
-            'data_freshness_days': 365,
-            'minimum_quality_score': 70
-        }
+        # Thresholds are plain attributes so each check is a direct attribute read
+        self._min_years = 10
+        self._min_commodities = 5
+        self._volatility_threshold = 100  # % change considered high volatility
+        self._freshness_days = 365
+        self._min_quality_score = 70
         
         self.validation_results = {}
         self.critical_issues = []
         self.warnings = []
         
+        # Read-only collector outputs shared by every validation step of a run, filled by _collect()
+        self._cache = MappingProxyType({})
+        
+        # Data-only step outputs of the last run and the collector data fingerprint they were built from
+        self._last_fingerprint = None
+        self._last_steps = {}
+        
+    @property
+    def validation_thresholds(self) -> Dict:
+        """Read-only view of the thresholds under their original names"""
+        return {
+            'minimum_years_coverage': self._min_years,
+            'minimum_commodities': self._min_commodities,
+            'price_volatility_threshold': self._volatility_threshold,
+            'data_freshness_days': self._freshness_days,
+            'minimum_quality_score': self._min_quality_score
+        }
+    
     def comprehensive_market_data_validation(self) -> Dict:
         """
         Comprehensive validation of all market data components
@@ -34,8 +79,18 @@ class MarketDataValidator:
         print("🔍 COMPREHENSIVE MARKET DATA VALIDATION")
         print("=" * 50)
         
+        # One clock read per run; the timestamp, freshness age and report name all use it
+        now = datetime.now(timezone.utc)
+        
+        # Every run collects afresh, once and before the steps fan out, so a collector
+        # failure surfaces here; only the steps that depend on the data alone are reused
+        fingerprint = self._data_fingerprint(self._collect())
+        reused = self._last_steps if fingerprint is not None and fingerprint == self._last_fingerprint else {}
+        if reused:
+            print("♻️ Collector data unchanged - reusing completeness, accuracy and business readiness results")
+        
         validation_results = {
-            'validation_timestamp': datetime.now().isoformat(),
+            'validation_timestamp': now.isoformat(),
             'overall_quality_score': 0,
             'overall_quality_rating': 'UNKNOWN',
             'data_completeness': {},
@@ -47,32 +102,41 @@ class MarketDataValidator:
             'recommendations': []
         }
         
-        # 1. Data Completeness Validation
-        print("\n📊 STEP 1: DATA COMPLETENESS VALIDATION")
-        print("-" * 40)
-        completeness_results = self._validate_data_completeness()
-        validation_results['data_completeness'] = completeness_results
-        
-        # 2. Data Accuracy Validation
-        print("\n📈 STEP 2: DATA ACCURACY VALIDATION")
-        print("-" * 35)
-        accuracy_results = self._validate_data_accuracy()
-        validation_results['data_accuracy'] = accuracy_results
-        
-        # 3. Data Freshness Validation
-        print("\n🕐 STEP 3: DATA FRESHNESS VALIDATION")
-        print("-" * 35)
-        freshness_results = self._validate_data_freshness()
-        validation_results['data_freshness'] = freshness_results
-        
-        # 4. Business Readiness Assessment
-        print("\n💼 STEP 4: BUSINESS READINESS ASSESSMENT")
-        print("-" * 40)
-        business_results = self._assess_business_readiness()
-        validation_results['business_readiness'] = business_results
+        # 1-4. Completeness, accuracy, freshness and business readiness only read the
+        # shared read-only collector cache, so they run side by side. Each step records its output
+        # and issues in its own message lists, replayed here in step order. Freshness
+        # depends on now, so it runs even when the other steps are reused.
+        steps = (
+            ('data_completeness', "📊 STEP 1: DATA COMPLETENESS VALIDATION", 40, self._validate_data_completeness),
+            ('data_accuracy', "📈 STEP 2: DATA ACCURACY VALIDATION", 35, self._validate_data_accuracy),
+            ('data_freshness', "🕐 STEP 3: DATA FRESHNESS VALIDATION", 35, partial(self._validate_data_freshness, now=now)),
+            ('business_readiness', "💼 STEP 4: BUSINESS READINESS ASSESSMENT", 40, self._assess_business_readiness)
+        )
+        step_messages = {key: {'log': [], 'warnings': [], 'critical_issues': []} for key, _, _, _ in steps}
+        
+        with ThreadPoolExecutor(max_workers=len(steps)) as executor:
+            futures = {key: executor.submit(step, step_messages[key]) for key, _, _, step in steps if key not in reused}
+        
+        step_outputs = {}
+        for key, title, rule_width, _ in steps:
+            if key in reused:
+                result, messages = copy.deepcopy(reused[key])
+            else:
+                result, messages = futures[key].result(), step_messages[key]
+            validation_results[key] = result
+            step_outputs[key] = (result, messages)
+            # Header and buffered step output go out in a single write
+            sys.stdout.write('\n'.join([f"\n{title}", "-" * rule_width, *messages['log']]) + '\n')
+            self.warnings.extend(messages['warnings'])
+            self.critical_issues.extend(messages['critical_issues'])
         
         # 5. Calculate Overall Quality Score
-        overall_score = self._calculate_overall_quality_score(validation_results)
+        overall_score = self._calculate_overall_quality_score(
+            validation_results['data_completeness'].get('overall_completeness_score', 0),
+            validation_results['data_accuracy'].get('overall_accuracy_score', 0),
+            validation_results['data_freshness'].get('score', 0),
+            validation_results['business_readiness'].get('overall_business_score', 0)
+        )
         validation_results['overall_quality_score'] = overall_score
         validation_results['overall_quality_rating'] = self._get_quality_rating(overall_score)
         
@@ -82,7 +146,7 @@ class MarketDataValidator:
         validation_results['recommendations'] = self._generate_recommendations(validation_results)
         
         # 7. Export validation report
-        self._export_validation_report(validation_results)
+        self._export_validation_report(validation_results, now)
         
         print(f"\n✅ VALIDATION COMPLETE")
         print(f"Overall Quality Score: {overall_score}/100")
@@ -90,10 +154,57 @@ class MarketDataValidator:
         print(f"Critical Issues: {len(self.critical_issues)}")
         print(f"Warnings: {len(self.warnings)}")
         
+        self._last_fingerprint = fingerprint
+        self._last_steps = copy.deepcopy({key: output for key, output in step_outputs.items() if key != 'data_freshness'})
+        
         return validation_results
     
-    def _validate_data_completeness(self) -> Dict:
+    def _collect(self) -> MappingProxyType:
+        """Fetch each collector output once per run; the validation steps only read the result"""
+        price_trends = self.usgs_collector.get_ree_price_trends()
+        n_years = 0 if price_trends is None or price_trends.empty else int(len(price_trends))
+        import_analysis = self.usgs_collector.get_import_dependency_analysis()
+        dependency = (import_analysis or {}).get('us_import_dependency', {})
+        quality = self.usgs_collector.validate_data_quality()
+        imp_vals = np.fromiter(dependency.values(), dtype=np.float64, count=len(dependency))
+        imp_vals.flags.writeable = False
+        self._cache = MappingProxyType({
+            'price_trends': price_trends,
+            'n_years': n_years,
+            # Summed straight off the bool array; no masked row copy just to count
+            'volatility_count': int(price_trends['volatility_high'].to_numpy(dtype=bool).sum()) if n_years else 0,
+            'import_analysis': import_analysis,
+            # Import dependency as parallel keys/values; the array feeds every count and bounds check
+            'imp_keys': tuple(dependency.keys()),
+            'imp_vals': imp_vals,
+            'supply_metrics': self.usgs_collector.get_supply_concentration_metrics(),
+            'market_events': self.usgs_collector.market_events,
+            'quality': quality,
+            'prelim_quality': (quality or {}).get('quality_score', 0)
+        })
+        return self._cache
+    
+    def _data_fingerprint(self, cache: MappingProxyType) -> Optional[str]:
+        """Hash of the collected data contents; None when they cannot be hashed"""
+        try:
+            digest = hashlib.sha1()
+            if cache['n_years']:
+                digest.update(cache['price_trends'].to_json(orient='split').encode())
+            # The quality report carries its own timestamp, so only its score is part of the data
+            digest.update(json.dumps(
+                [cache['import_analysis'], cache['supply_metrics'], cache['market_events'], cache['prelim_quality']],
+                sort_keys=True, default=str
+            ).encode())
+            return digest.hexdigest()
+        except Exception:
+            return None
+    
+    def _validate_data_completeness(self, messages: Dict) -> Dict:
         """Validate completeness of market data components"""
+        log = messages['log'].append
+        warn = messages['warnings'].append
+        crit = messages['critical_issues'].append
+        
         completeness_results = {
             'price_trends': {'status': 'UNKNOWN', 'coverage_years': 0, 'score': 0},
             'import_dependency': {'status': 'UNKNOWN', 'commodities_covered': 0, 'score': 0},
@@ -103,86 +214,96 @@ class MarketDataValidator:
         }
         
         try:
+            cache = self._cache
+            # Component scores are summed as each one is settled
+            score_total = 0
+            
             # Validate price trends
-            price_trends = self.usgs_collector.get_ree_price_trends()
-            if not price_trends.empty:
-                years_covered = len(price_trends)
+            years_covered = cache['n_years']
+            if years_covered:
                 completeness_results['price_trends']['coverage_years'] = years_covered
-                if years_covered >= self.validation_thresholds['minimum_years_coverage']:
+                if years_covered >= self._min_years:
                     completeness_results['price_trends']['status'] = 'COMPLETE'
                     completeness_results['price_trends']['score'] = 100
-                    print(f"✅ Price trends: {years_covered} years covered")
+                    log(f"✅ Price trends: {years_covered} years covered")
                 else:
                     completeness_results['price_trends']['status'] = 'INCOMPLETE'
                     completeness_results['price_trends']['score'] = 60
-                    self.warnings.append(f"Price trends only cover {years_covered} years, minimum {self.validation_thresholds['minimum_years_coverage']} recommended")
+                    warn(f"Price trends only cover {years_covered} years, minimum {self._min_years} recommended")
             else:
                 completeness_results['price_trends']['status'] = 'MISSING'
-                self.critical_issues.append("Price trends data is missing")
+                crit("Price trends data is missing")
+            score_total += completeness_results['price_trends']['score']
             
             # Validate import dependency
-            import_analysis = self.usgs_collector.get_import_dependency_analysis()
+            import_analysis = cache['import_analysis']
             if import_analysis and 'us_import_dependency' in import_analysis:
-                commodities_count = len(import_analysis['us_import_dependency'])
+                commodities_count = len(cache['imp_vals'])
                 completeness_results['import_dependency']['commodities_covered'] = commodities_count
-                if commodities_count >= self.validation_thresholds['minimum_commodities']:
+                if commodities_count >= self._min_commodities:
                     completeness_results['import_dependency']['status'] = 'COMPLETE'
                     completeness_results['import_dependency']['score'] = 100
-                    print(f"✅ Import dependency: {commodities_count} commodities covered")
+                    log(f"✅ Import dependency: {commodities_count} commodities covered")
                 else:
                     completeness_results['import_dependency']['status'] = 'INCOMPLETE'
                     completeness_results['import_dependency']['score'] = 70
-                    self.warnings.append(f"Import dependency covers {commodities_count} commodities, minimum {self.validation_thresholds['minimum_commodities']} recommended")
+                    warn(f"Import dependency covers {commodities_count} commodities, minimum {self._min_commodities} recommended")
             else:
                 completeness_results['import_dependency']['status'] = 'MISSING'
-                self.critical_issues.append("Import dependency data is missing")
+                crit("Import dependency data is missing")
+            score_total += completeness_results['import_dependency']['score']
             
             # Validate supply concentration
-            supply_metrics = self.usgs_collector.get_supply_concentration_metrics()
+            supply_metrics = cache['supply_metrics']
             if supply_metrics and isinstance(supply_metrics, dict):
                 metrics_count = len([k for k in supply_metrics.keys() if not k.startswith('risk_')])
                 completeness_results['supply_concentration']['metrics_available'] = metrics_count
                 if metrics_count >= 3:  # china_market_share, herfindahl_index, top3_countries_share
                     completeness_results['supply_concentration']['status'] = 'COMPLETE'
                     completeness_results['supply_concentration']['score'] = 100
-                    print(f"✅ Supply concentration: {metrics_count} metrics available")
+                    log(f"✅ Supply concentration: {metrics_count} metrics available")
                 else:
                     completeness_results['supply_concentration']['status'] = 'INCOMPLETE'
                     completeness_results['supply_concentration']['score'] = 60
-                    self.warnings.append(f"Supply concentration has {metrics_count} metrics, expected at least 3")
+                    warn(f"Supply concentration has {metrics_count} metrics, expected at least 3")
             else:
                 completeness_results['supply_concentration']['status'] = 'MISSING'
-                self.critical_issues.append("Supply concentration data is missing")
+                crit("Supply concentration data is missing")
+            score_total += completeness_results['supply_concentration']['score']
             
             # Validate market events
-            market_events = self.usgs_collector.market_events
+            market_events = cache['market_events']
             if market_events and isinstance(market_events, dict):
                 events_count = len(market_events)
                 completeness_results['market_events']['events_tracked'] = events_count
                 if events_count >= 5:
                     completeness_results['market_events']['status'] = 'COMPLETE'
                     completeness_results['market_events']['score'] = 100
-                    print(f"✅ Market events: {events_count} events tracked")
+                    log(f"✅ Market events: {events_count} events tracked")
                 else:
                     completeness_results['market_events']['status'] = 'INCOMPLETE'
                     completeness_results['market_events']['score'] = 70
-                    self.warnings.append(f"Market events tracks {events_count} events, expected at least 5")
+                    warn(f"Market events tracks {events_count} events, expected at least 5")
             else:
                 completeness_results['market_events']['status'] = 'MISSING'
-                self.critical_issues.append("Market events data is missing")
+                crit("Market events data is missing")
+            score_total += completeness_results['market_events']['score']
             
             # Calculate overall completeness score
-            scores = [completeness_results[component]['score'] for component in ['price_trends', 'import_dependency', 'supply_concentration', 'market_events']]
-            completeness_results['overall_completeness_score'] = sum(scores) / len(scores)
+            completeness_results['overall_completeness_score'] = score_total / 4
             
         except Exception as e:
-            self.critical_issues.append(f"Data completeness validation failed: {str(e)}")
+            crit(f"Data completeness validation failed: {str(e)}")
             completeness_results['overall_completeness_score'] = 0
         
         return completeness_results
     
-    def _validate_data_accuracy(self) -> Dict:
+    def _validate_data_accuracy(self, messages: Dict) -> Dict:
         """Validate accuracy and consistency of market data"""
+        log = messages['log'].append
+        warn = messages['warnings'].append
+        crit = messages['critical_issues'].append
+        
         accuracy_results = {
             'price_consistency': {'status': 'UNKNOWN', 'score': 0},
             'logical_consistency': {'status': 'UNKNOWN', 'score': 0},
@@ -191,79 +312,93 @@ class MarketDataValidator:
         }
         
         try:
+            cache = self._cache
+            # Component scores are summed as each one is settled
+            score_total = 0
+            
             # Validate price consistency
-            price_trends = self.usgs_collector.get_ree_price_trends()
-            if not price_trends.empty:
-                # Check for reasonable price ranges
-                max_price = price_trends['neodymium_price_index'].max()
-                min_price = price_trends['neodymium_price_index'].min()
+            if cache['n_years']:
+                price_trends = cache['price_trends']
+                # Price range in one aggregation pass
+                price_range = price_trends['neodymium_price_index'].agg(['min', 'max'])
+                max_price = price_range['max']
+                min_price = price_range['min']
                 
+                # Check for reasonable price ranges
                 if max_price > 0 and min_price > 0 and max_price >= min_price:
                     # Check for extreme volatility (known 2011 spike should be captured)
-                    volatility_events = price_trends[price_trends['volatility_high'] == True]
-                    if len(volatility_events) > 0:
+                    volatility_count = cache['volatility_count']
+                    if volatility_count > 0:
                         accuracy_results['price_consistency']['status'] = 'ACCURATE'
                         accuracy_results['price_consistency']['score'] = 100
-                        print(f"✅ Price consistency: {len(volatility_events)} volatility events detected")
+                        log(f"✅ Price consistency: {volatility_count} volatility events detected")
                     else:
                         accuracy_results['price_consistency']['status'] = 'QUESTIONABLE'
                         accuracy_results['price_consistency']['score'] = 60
-                        self.warnings.append("No high volatility events detected - may miss known market disruptions")
+                        warn("No high volatility events detected - may miss known market disruptions")
                 else:
                     accuracy_results['price_consistency']['status'] = 'INACCURATE'
                     accuracy_results['price_consistency']['score'] = 20
-                    self.critical_issues.append("Price data contains invalid values")
+                    crit("Price data contains invalid values")
+            score_total += accuracy_results['price_consistency']['score']
             
             # Validate logical consistency
-            import_analysis = self.usgs_collector.get_import_dependency_analysis()
-            supply_metrics = self.usgs_collector.get_supply_concentration_metrics()
+            import_analysis = cache['import_analysis']
+            supply_metrics = cache['supply_metrics']
+            percentages = cache['imp_vals']
             
             logical_score = 100
             if import_analysis and supply_metrics:
                 # Check if high import dependency aligns with high supply concentration
-                high_dependency_commodities = [k for k, v in import_analysis['us_import_dependency'].items() if v >= 80]
+                high_dependency_count = int((percentages >= 80).sum())
                 china_dominance = supply_metrics.get('china_market_share', 0)
                 
-                if len(high_dependency_commodities) > 0 and china_dominance >= 80:
+                if high_dependency_count > 0 and china_dominance >= 80:
                     accuracy_results['logical_consistency']['status'] = 'CONSISTENT'
-                    print(f"✅ Logical consistency: High import dependency aligns with supply concentration")
+                    log(f"✅ Logical consistency: High import dependency aligns with supply concentration")
                 else:
                     accuracy_results['logical_consistency']['status'] = 'INCONSISTENT'
                     logical_score = 60
-                    self.warnings.append("Import dependency and supply concentration metrics may be inconsistent")
+                    warn("Import dependency and supply concentration metrics may be inconsistent")
             else:
                 logical_score = 0
-                self.critical_issues.append("Cannot validate logical consistency - missing data")
+                crit("Cannot validate logical consistency - missing data")
             
             accuracy_results['logical_consistency']['score'] = logical_score
+            score_total += logical_score
             
             # Validate value ranges
             range_score = 100
             if import_analysis:
-                for commodity, percentage in import_analysis['us_import_dependency'].items():
-                    if not (0 <= percentage <= 100):
-                        range_score = 20
-                        self.critical_issues.append(f"Import dependency percentage out of range for {commodity}: {percentage}%")
-                        break
+                # Negated in-range test so NaN percentages are flagged too
+                out_of_range = ~((percentages >= 0) & (percentages <= 100))
+                if out_of_range.any():
+                    commodity = cache['imp_keys'][int(out_of_range.argmax())]
+                    range_score = 20
+                    crit(f"Import dependency percentage out of range for {commodity}: {import_analysis['us_import_dependency'][commodity]}%")
             
             accuracy_results['value_ranges']['status'] = 'VALID' if range_score == 100 else 'INVALID'
             accuracy_results['value_ranges']['score'] = range_score
+            score_total += range_score
             
             if range_score == 100:
-                print(f"✅ Value ranges: All percentages within valid bounds")
+                log(f"✅ Value ranges: All percentages within valid bounds")
             
             # Calculate overall accuracy score
-            scores = [accuracy_results[component]['score'] for component in ['price_consistency', 'logical_consistency', 'value_ranges']]
-            accuracy_results['overall_accuracy_score'] = sum(scores) / len(scores)
+            accuracy_results['overall_accuracy_score'] = score_total / 3
             
         except Exception as e:
-            self.critical_issues.append(f"Data accuracy validation failed: {str(e)}")
+            crit(f"Data accuracy validation failed: {str(e)}")
             accuracy_results['overall_accuracy_score'] = 0
         
         return accuracy_results
     
-    def _validate_data_freshness(self) -> Dict:
+    def _validate_data_freshness(self, messages: Dict, now: datetime) -> Dict:
         """Validate freshness and timeliness of market data"""
+        log = messages['log'].append
+        warn = messages['warnings'].append
+        crit = messages['critical_issues'].append
+        
         freshness_results = {
             'data_age_days': 0,
             'freshness_status': 'UNKNOWN',
@@ -273,11 +408,14 @@ class MarketDataValidator:
         
         try:
             # Since we're using synthetic data, we consider it fresh
-            validation_data = self.usgs_collector.validate_data_quality()
+            cache = self._cache
+            validation_data = cache['quality']
             
             if validation_data and 'validation_timestamp' in validation_data:
-                last_update = datetime.fromisoformat(validation_data['validation_timestamp'].replace('Z', '+00:00'))
-                data_age = (datetime.now() - last_update).days
+                # Naive collector timestamps are local time
+                updated = datetime.fromisoformat(validation_data['validation_timestamp'].replace('Z', '+00:00')).astimezone(timezone.utc)
+                # Collected during this run, so it may be a few microseconds newer than now
+                data_age = max((now - updated).days, 0)
                 
                 freshness_results['data_age_days'] = data_age
                 freshness_results['last_update'] = validation_data['validation_timestamp']
@@ -285,28 +423,32 @@ class MarketDataValidator:
                 if data_age <= 1:  # Data created today
                     freshness_results['freshness_status'] = 'FRESH'
                     freshness_results['score'] = 100
-                    print(f"✅ Data freshness: {data_age} days old (FRESH)")
+                    log(f"✅ Data freshness: {data_age} days old (FRESH)")
                 elif data_age <= 30:
                     freshness_results['freshness_status'] = 'ACCEPTABLE'
                     freshness_results['score'] = 80
-                    print(f"⚠️ Data freshness: {data_age} days old (ACCEPTABLE)")
+                    log(f"⚠️ Data freshness: {data_age} days old (ACCEPTABLE)")
                 else:
                     freshness_results['freshness_status'] = 'STALE'
                     freshness_results['score'] = 40
-                    self.warnings.append(f"Market data is {data_age} days old, consider updating")
+                    warn(f"Market data is {data_age} days old, consider updating")
             else:
                 freshness_results['freshness_status'] = 'UNKNOWN'
                 freshness_results['score'] = 50
-                self.warnings.append("Cannot determine data freshness")
+                warn("Cannot determine data freshness")
                 
         except Exception as e:
-            self.critical_issues.append(f"Data freshness validation failed: {str(e)}")
+            crit(f"Data freshness validation failed: {str(e)}")
             freshness_results['score'] = 0
         
         return freshness_results
     
-    def _assess_business_readiness(self) -> Dict:
+    def _assess_business_readiness(self, messages: Dict) -> Dict:
         """Assess readiness for business/consulting use"""
+        log = messages['log'].append
+        warn = messages['warnings'].append
+        crit = messages['critical_issues'].append
+        
         business_results = {
             'executive_presentation_ready': False,
             'consulting_grade_quality': False,
@@ -316,62 +458,59 @@ class MarketDataValidator:
         }
         
         try:
+            cache = self._cache
+            # Counts the four readiness factors that hold
+            ready_factors = 0
+            
             # Check if data supports executive presentations
-            price_trends = self.usgs_collector.get_ree_price_trends()
-            supply_metrics = self.usgs_collector.get_supply_concentration_metrics()
+            supply_metrics = cache['supply_metrics']
             
-            if not price_trends.empty and supply_metrics:
+            if cache['n_years'] and supply_metrics:
                 # Has compelling story: price volatility + supply concentration risk
-                volatility_events = price_trends[price_trends['volatility_high'] == True]
+                volatility_count = cache['volatility_count']
                 china_dominance = supply_metrics.get('china_market_share', 0)
                 
-                if len(volatility_events) > 0 and china_dominance >= 80:
+                if volatility_count > 0 and china_dominance >= 80:
                     business_results['executive_presentation_ready'] = True
-                    print(f"✅ Executive presentation ready: Compelling risk narrative available")
+                    ready_factors += 1
+                    log(f"✅ Executive presentation ready: Compelling risk narrative available")
                 else:
-                    self.warnings.append("Limited compelling narrative for executive presentations")
+                    warn("Limited compelling narrative for executive presentations")
             
             # Check consulting grade quality
             overall_quality = self._get_preliminary_quality_score()
-            if overall_quality >= self.validation_thresholds['minimum_quality_score']:
+            if overall_quality >= self._min_quality_score:
                 business_results['consulting_grade_quality'] = True
-                print(f"✅ Consulting grade quality: {overall_quality}/100")
+                ready_factors += 1
+                log(f"✅ Consulting grade quality: {overall_quality}/100")
             else:
-                self.warnings.append(f"Quality score {overall_quality} below consulting threshold {self.validation_thresholds['minimum_quality_score']}")
+                warn(f"Quality score {overall_quality} below consulting threshold {self._min_quality_score}")
             
             # Check cost savings demonstration capability
             # Synthetic data provides immediate cost savings vs. commercial databases
             business_results['cost_savings_demonstrable'] = True
-            print(f"✅ Cost savings demonstrable: Immediate vs. €45k commercial alternatives")
+            ready_factors += 1
+            log(f"✅ Cost savings demonstrable: Immediate vs. €45k commercial alternatives")
             
             # Check competitive advantage
             # Unique patent-market correlation provides competitive advantage
             business_results['competitive_advantage'] = True
-            print(f"✅ Competitive advantage: Unique patent-market correlation analysis")
+            ready_factors += 1
+            log(f"✅ Competitive advantage: Unique patent-market correlation analysis")
             
             # Calculate overall business score
-            business_factors = [
-                business_results['executive_presentation_ready'],
-                business_results['consulting_grade_quality'],
-                business_results['cost_savings_demonstrable'],
-                business_results['competitive_advantage']
-            ]
-            business_results['overall_business_score'] = (sum(business_factors) / len(business_factors)) * 100
+            business_results['overall_business_score'] = (ready_factors / 4) * 100
             
         except Exception as e:
-            self.critical_issues.append(f"Business readiness assessment failed: {str(e)}")
+            crit(f"Business readiness assessment failed: {str(e)}")
             business_results['overall_business_score'] = 0
         
         return business_results
     
-    def _calculate_overall_quality_score(self, validation_results: Dict) -> int:
+    def _calculate_overall_quality_score(self, completeness_score: float, accuracy_score: float,
+                                         freshness_score: float, business_score: float) -> int:
         """Calculate overall quality score from all validation components"""
         try:
-            completeness_score = validation_results['data_completeness'].get('overall_completeness_score', 0)
-            accuracy_score = validation_results['data_accuracy'].get('overall_accuracy_score', 0)
-            freshness_score = validation_results['data_freshness'].get('score', 0)
-            business_score = validation_results['business_readiness'].get('overall_business_score', 0)
-            
             # Weighted average (completeness and accuracy are most important)
             overall_score = (
                 completeness_score * 0.35 +
@@ -389,23 +528,13 @@ class MarketDataValidator:
     def _get_preliminary_quality_score(self) -> int:
         """Get preliminary quality score for business assessment"""
         try:
-            validation_data = self.usgs_collector.validate_data_quality()
-            return validation_data.get('quality_score', 0)
+            return self._cache['prelim_quality']
         except:
             return 0
     
     def _get_quality_rating(self, score: int) -> str:
         """Convert quality score to business rating"""
-        if score >= 90:
-            return 'EXCELLENT'
-        elif score >= 80:
-            return 'GOOD'
-        elif score >= 70:
-            return 'ACCEPTABLE'
-        elif score >= 60:
-            return 'NEEDS_IMPROVEMENT'
-        else:
-            return 'INADEQUATE'
+        return _rating_for(score)
     
     def _generate_recommendations(self, validation_results: Dict) -> List[str]:
         """Generate actionable recommendations based on validation results"""
@@ -435,13 +564,25 @@ class MarketDataValidator:
         
         return recommendations
     
-    def _export_validation_report(self, validation_results: Dict):
+    def _export_validation_report(self, validation_results: Dict, now: datetime):
         """Export comprehensive validation report"""
         try:
-            report_filename = f"market_data_validation_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+            report_filename = f"market_data_validation_report_{now.strftime('%Y%m%d_%H%M%S')}.json"
             
-            with open(report_filename, 'w') as f:
-                json.dump(validation_results, f, indent=2)
+            if orjson is not None:
+                option = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                with open(report_filename, 'wb') as f:
+                    # Encode one top-level section at a time so peak memory follows the largest
+                    # section, not the whole report; the bytes match a single indented dump
+                    separator = b'{\n  '
+                    for key, value in validation_results.items():
+                        section = orjson.dumps(value, option=option, default=str).replace(b'\n', b'\n  ')
+                        f.write(separator + orjson.dumps(key, option=option, default=str) + b': ' + section)
+                        separator = b',\n  '
+                    f.write(b'\n}' if validation_results else b'{}')
+            else:
+                with open(report_filename, 'w') as f:
+                    json.dump(validation_results, f, indent=2)
             
             print(f"📄 Validation report exported: {report_filename}")
             
@@ -1,12 +1,29 @@
-import pandas as pd
 import numpy as np
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Tuple, Optional
+import copy
 import json
-from dataclasses import dataclass
-from usgs_market_collector import USGSMineralDataCollector
+from types import MappingProxyType
+from dataclasses import dataclass, asdict
 
-@dataclass
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+EVENT_TYPES = ('POLICY', 'TRADE', 'SUPPLY', 'DEMAND', 'CRISIS')
+SEVERITY_LEVELS = ('LOW', 'MODERATE', 'HIGH', 'EXTREME')
+TYPE_CODES = {name: code for code, name in enumerate(EVENT_TYPES)}
+SEVERITY_CODES = {name: code for code, name in enumerate(SEVERITY_LEVELS)}
+
+def _ranked_counts(codes: np.ndarray, names: Tuple[str, ...]) -> Dict[str, int]:
+    """value_counts()-style dict from integer codes: most frequent first, ties in first-seen order"""
+    counts = np.bincount(codes, minlength=len(names))
+    present, first_seen = np.unique(codes, return_index=True)
+    order = present[np.lexsort((first_seen, -counts[present]))]
+    return {names[code]: int(counts[code]) for code in order}
+
+@dataclass(frozen=True, slots=True)
 class MarketEvent:
     """Data class for market disruption events"""
     year: int
@@ -16,18 +33,123 @@ class MarketEvent:
     duration_months: int
     price_impact_pct: float
     supply_impact: str
-    affected_commodities: List[str]
+    affected_commodities: Tuple[str, ...]
     geopolitical_context: str
     expected_innovation_response: str
 
+# Future disruption scenarios; constants shared by every prediction report
+_POTENTIAL_EVENTS = (
+    {
+        'timeframe': '2025-2026',
+        'event': 'US-China Tech Competition Escalation',
+        'probability': 'HIGH',
+        'potential_impact': 'Trade restrictions on advanced REE processing technology',
+        'affected_commodities': ('high-purity REE', 'processed magnets'),
+        'innovation_response': 'Western REE processing technology acceleration'
+    },
+    {
+        'timeframe': '2026-2027',
+        'event': 'EU Critical Materials Act Full Implementation',
+        'probability': 'CERTAIN',
+        'potential_impact': 'Mandatory recycling quotas and supply chain requirements',
+        'affected_commodities': ('rare_earths', 'lithium', 'cobalt'),
+        'innovation_response': 'Circular economy technology boom'
+    },
+    {
+        'timeframe': '2027-2028',
+        'event': 'India-China Border Tensions Impact Mining',
+        'probability': 'MODERATE',
+        'potential_impact': 'Alternative supply chain route disruptions',
+        'affected_commodities': ('rare_earths',),
+        'innovation_response': 'Supply chain traceability systems'
+    },
+    {
+        'timeframe': '2028-2030',
+        'event': 'Climate Change Mining Disruptions',
+        'probability': 'HIGH',
+        'potential_impact': 'Weather-related mining operations interruptions',
+        'affected_commodities': ('rare_earths', 'lithium'),
+        'innovation_response': 'Climate-resilient extraction technologies'
+    },
+    {
+        'timeframe': '2030-2032',
+        'event': 'Space-Based Mining Technology Breakthrough',
+        'probability': 'LOW',
+        'potential_impact': 'Potential disruption to terrestrial REE markets',
+        'affected_commodities': ('high-value REE',),
+        'innovation_response': 'Cost-competitive terrestrial alternatives'
+    }
+)
+
+# Risk assessment framework
+_RISK_ASSESSMENT = {
+    'highest_probability_risks': (
+        'EU regulatory compliance requirements',
+        'US-China technology competition',
+        'Climate-related supply disruptions'
+    ),
+    'highest_impact_risks': (
+        'Major geopolitical conflict affecting supply chains',
+        'Climate change mining disruptions',
+        'Breakthrough alternative materials technology'
+    ),
+    'preparedness_recommendations': (
+        'Accelerate recycling technology development',
+        'Diversify supply sources beyond China',
+        'Invest in rare earth-free alternatives',
+        'Build strategic material reserves',
+        'Enhance supply chain traceability'
+    )
+}
+
+# Early warning indicators
+_EARLY_WARNING_INDICATORS = {
+    'geopolitical_tensions': (
+        'US-China trade policy changes',
+        'China export policy modifications',
+        'International dispute escalations'
+    ),
+    'supply_chain_stress': (
+        'Mining operation disruptions',
+        'Processing capacity bottlenecks',
+        'Transportation route issues'
+    ),
+    'demand_surge_signals': (
+        'EV adoption acceleration',
+        'Renewable energy deployment rates',
+        'Defense spending increases'
+    ),
+    'technology_disruption': (
+        'Alternative materials breakthroughs',
+        'Recycling efficiency improvements',
+        'New extraction technologies'
+    )
+}
+
+_PREDICTION_BASE = MappingProxyType({
+    'potential_future_events': _POTENTIAL_EVENTS,
+    'risk_assessment': _RISK_ASSESSMENT,
+    'early_warning_indicators': _EARLY_WARNING_INDICATORS,
+    'monitoring_recommendations': (
+        'Monthly geopolitical risk assessment',
+        'Quarterly supply chain vulnerability analysis',
+        'Annual technology disruption impact evaluation',
+        'Continuous price and policy monitoring'
+    ),
+    'prediction_confidence': 'MODERATE - Based on historical patterns and current trends'
+})
+
 class MarketEventAnalyzer:
     """
     Historical Market Disruption Analysis for REE Sector
     Provides deep intelligence on market events and their innovation impacts
     """
     
+    # Severity score indexed by severity code (LOW=1 ... EXTREME=4)
+    _SCORE_LUT = np.array([1, 2, 3, 4], dtype=np.float64)
+    
     def __init__(self):
-        self.usgs_collector = USGSMineralDataCollector()
+        self._usgs = None
         
         # Comprehensive REE market event database
         self.historical_events = [
@@ -39,7 +161,7 @@ class MarketEventAnalyzer:
                 duration_months=12,
                 price_impact_pct=200,
                 supply_impact="Global supply disruption begins",
-                affected_commodities=['neodymium', 'dysprosium', 'terbium', 'europium'],
+                affected_commodities=('neodymium', 'dysprosium', 'terbium', 'europium'),
                 geopolitical_context="China begins strategic control of REE exports",
                 expected_innovation_response="Alternative materials research initiation"
             ),
@@ -51,7 +173,7 @@ class MarketEventAnalyzer:
                 duration_months=18,
                 price_impact_pct=700,
                 supply_impact="Critical supply shortage worldwide",
-                affected_commodities=['neodymium', 'dysprosium', 'terbium'],
+                affected_commodities=('neodymium', 'dysprosium', 'terbium'),
                 geopolitical_context="WTO disputes initiated by US, EU, Japan",
                 expected_innovation_response="Massive alternative materials R&D investment"
             ),
@@ -63,7 +185,7 @@ class MarketEventAnalyzer:
                 duration_months=24,
                 price_impact_pct=-40,
                 supply_impact="Gradual market stabilization",
-                affected_commodities=['rare_earths'],
+                affected_commodities=('rare_earths',),
                 geopolitical_context="International legal pressure on China",
                 expected_innovation_response="Continued investment in alternatives"
             ),
@@ -75,7 +197,7 @@ class MarketEventAnalyzer:
                 duration_months=36,
                 price_impact_pct=-60,
                 supply_impact="Supply normalization with production controls",
-                affected_commodities=['rare_earths'],
+                affected_commodities=('rare_earths',),
                 geopolitical_context="Compliance with WTO ruling",
                 expected_innovation_response="Efficiency focus as prices normalize"
             ),
@@ -87,7 +209,7 @@ class MarketEventAnalyzer:
                 duration_months=48,
                 price_impact_pct=15,
                 supply_impact="US domestic production initiatives",
-                affected_commodities=['rare_earths', 'lithium', 'cobalt'],
+                affected_commodities=('rare_earths', 'lithium', 'cobalt'),
                 geopolitical_context="Trump administration strategic minerals focus",
                 expected_innovation_response="Government-funded research surge"
             ),
@@ -99,7 +221,7 @@ class MarketEventAnalyzer:
                 duration_months=24,
                 price_impact_pct=120,
                 supply_impact="Supply chain uncertainty",
-                affected_commodities=['rare_earths', 'neodymium'],
+                affected_commodities=('rare_earths', 'neodymium'),
                 geopolitical_context="REE as potential trade weapon",
                 expected_innovation_response="Supply chain diversification R&D"
             ),
@@ -111,7 +233,7 @@ class MarketEventAnalyzer:
                 duration_months=18,
                 price_impact_pct=80,
                 supply_impact="Global supply chain fragility exposed",
-                affected_commodities=['rare_earths', 'lithium', 'cobalt'],
+                affected_commodities=('rare_earths', 'lithium', 'cobalt'),
                 geopolitical_context="Pandemic reveals supply chain vulnerabilities",
                 expected_innovation_response="Supply security and reshoring technologies"
             ),
@@ -123,7 +245,7 @@ class MarketEventAnalyzer:
                 duration_months=12,
                 price_impact_pct=180,
                 supply_impact="EV transition drives demand spike",
-                affected_commodities=['neodymium', 'dysprosium', 'lithium'],
+                affected_commodities=('neodymium', 'dysprosium', 'lithium'),
                 geopolitical_context="Green transition accelerates globally",
                 expected_innovation_response="EV efficiency and recycling focus"
             ),
@@ -135,7 +257,7 @@ class MarketEventAnalyzer:
                 duration_months=24,
                 price_impact_pct=150,
                 supply_impact="Energy transition urgency increases",
-                affected_commodities=['rare_earths', 'lithium'],
+                affected_commodities=('rare_earths', 'lithium'),
                 geopolitical_context="Europe accelerates renewable energy transition",
                 expected_innovation_response="Energy independence technologies"
             ),
@@ -147,7 +269,7 @@ class MarketEventAnalyzer:
                 duration_months=36,
                 price_impact_pct=25,
                 supply_impact="European supply chain requirements",
-                affected_commodities=['rare_earths', 'lithium', 'cobalt'],
+                affected_commodities=('rare_earths', 'lithium', 'cobalt'),
                 geopolitical_context="EU strategic autonomy initiative",
                 expected_innovation_response="Circular economy and recycling innovation"
             ),
@@ -159,54 +281,80 @@ class MarketEventAnalyzer:
                 duration_months=12,
                 price_impact_pct=-20,
                 supply_impact="Increased global processing capacity",
-                affected_commodities=['rare_earths'],
+                affected_commodities=('rare_earths',),
                 geopolitical_context="China maintains downstream dominance",
                 expected_innovation_response="Western processing technology development"
             )
         ]
+        
+        # Struct-of-arrays view of the event table, built once since events never change
+        events = self.historical_events
+        n_events = len(events)
+        self._years = np.fromiter((e.year for e in events), dtype=np.int16, count=n_events)
+        self._price = np.fromiter((e.price_impact_pct for e in events), dtype=np.float64, count=n_events)
+        self._duration = np.fromiter((e.duration_months for e in events), dtype=np.int16, count=n_events)
+        self._sev_code = np.fromiter((SEVERITY_CODES[e.severity] for e in events), dtype=np.int8, count=n_events)
+        self._type_code = np.fromiter((TYPE_CODES[e.event_type] for e in events), dtype=np.int8, count=n_events)
+        self._events_by_type = {
+            name: np.flatnonzero(self._type_code == code).astype(np.int32)
+            for code, name in enumerate(EVENT_TYPES)
+        }
+        self._event_dicts = tuple(asdict(e) for e in events)
+        
+        # Geopolitically driven events (China/US context), presorted by year
+        self._geo_mask = np.fromiter(
+            ('China' in e.geopolitical_context or 'US' in e.geopolitical_context for e in events),
+            dtype=bool, count=n_events
+        )
+        geo_idx = np.flatnonzero(self._geo_mask)
+        self._geo_order = geo_idx[np.argsort(self._years[geo_idx], kind='stable')]
+        
+        # The historical analysis depends only on the fixed event table; computed on first use
+        self._historical_cache = None
+    
+    @property
+    def usgs_collector(self):
+        """USGS collector, created on first access"""
+        if self._usgs is None:
+            from usgs_market_collector import USGSMineralDataCollector
+            self._usgs = USGSMineralDataCollector()
+        return self._usgs
     
-    def analyze_historical_disruptions(self) -> Dict:
+    def analyze_historical_disruptions(self, ts: Optional[str] = None) -> Dict:
         """Comprehensive analysis of historical market disruptions"""
         print("📊 ANALYZING HISTORICAL MARKET DISRUPTIONS")
         print("-" * 45)
         
-        # Create analysis dataframe
-        events_data = []
-        for event in self.historical_events:
-            events_data.append({
-                'year': event.year,
-                'event_name': event.event_name,
-                'event_type': event.event_type,
-                'severity': event.severity,
-                'duration_months': event.duration_months,
-                'price_impact_pct': event.price_impact_pct,
-                'supply_impact': event.supply_impact,
-                'affected_commodities': len(event.affected_commodities),
-                'geopolitical_context': event.geopolitical_context,
-                'expected_innovation_response': event.expected_innovation_response
-            })
+        if self._historical_cache is None:
+            self._historical_cache = self._compute_historical()
+        disruption_statistics = self._historical_cache['disruption_statistics']
         
-        events_df = pd.DataFrame(events_data)
+        print(f"✅ Historical analysis: {disruption_statistics['total_events']} events analyzed")
+        print(f"   Extreme events: {disruption_statistics['extreme_events']}")
+        print(f"   Average price impact: {disruption_statistics['average_price_impact']:.1f}%")
         
+        # Deep copy so callers can edit their report without touching the cache
+        historical_analysis = copy.deepcopy(self._historical_cache)
+        historical_analysis['analysis_timestamp'] = ts or datetime.now().isoformat()
+        return historical_analysis
+    
+    def _compute_historical(self) -> Dict:
+        """Build the timestamp-free historical analysis once"""
         # Statistical analysis
         disruption_statistics = {
             'total_events': len(self.historical_events),
-            'events_by_type': events_df['event_type'].value_counts().to_dict(),
-            'events_by_severity': events_df['severity'].value_counts().to_dict(),
-            'average_duration_months': events_df['duration_months'].mean(),
-            'average_price_impact': events_df['price_impact_pct'].mean(),
-            'maximum_price_impact': events_df['price_impact_pct'].max(),
-            'minimum_price_impact': events_df['price_impact_pct'].min(),
-            'extreme_events': len(events_df[events_df['severity'] == 'EXTREME']),
-            'high_severity_events': len(events_df[events_df['severity'] == 'HIGH'])
+            'events_by_type': _ranked_counts(self._type_code, EVENT_TYPES),
+            'events_by_severity': _ranked_counts(self._sev_code, SEVERITY_LEVELS),
+            'average_duration_months': float(self._duration.mean()),
+            'average_price_impact': float(self._price.mean()),
+            'maximum_price_impact': float(self._price.max()),
+            'minimum_price_impact': float(self._price.min()),
+            'extreme_events': int((self._sev_code == SEVERITY_CODES['EXTREME']).sum()),
+            'high_severity_events': int((self._sev_code == SEVERITY_CODES['HIGH']).sum())
         }
         
-        print(f"✅ Historical analysis: {disruption_statistics['total_events']} events analyzed")
-        print(f"   Extreme events: {disruption_statistics['extreme_events']}")
-        print(f"   Average price impact: {disruption_statistics['average_price_impact']:.1f}%")
-        
         # Disruption patterns analysis
-        disruption_patterns = self._analyze_disruption_patterns(events_df)
+        disruption_patterns = self._analyze_disruption_patterns()
         
         # Event correlation analysis
         event_correlations = self._analyze_event_correlations()
@@ -219,54 +367,61 @@ class MarketEventAnalyzer:
             'disruption_patterns': disruption_patterns,
             'event_correlations': event_correlations,
             'recovery_analysis': recovery_analysis,
-            'historical_events': [event.__dict__ for event in self.historical_events],
-            'analysis_timestamp': datetime.now().isoformat()
+            'historical_events': self._event_dicts
         }
     
-    def _analyze_disruption_patterns(self, events_df: pd.DataFrame) -> Dict:
+    def _analyze_disruption_patterns(self) -> Dict:
         """Analyze patterns in market disruptions"""
         patterns = {}
+        years, price, sev_code = self._years, self._price, self._sev_code
         
         # Temporal patterns
+        # Half-open bins, except np.histogram closes the last one: [2020, 2024]
+        decade_counts, _ = np.histogram(years, bins=np.array([2010, 2015, 2020, 2024]))
         events_by_decade = {
-            '2010-2014': len(events_df[(events_df['year'] >= 2010) & (events_df['year'] <= 2014)]),
-            '2015-2019': len(events_df[(events_df['year'] >= 2015) & (events_df['year'] <= 2019)]),
-            '2020-2024': len(events_df[(events_df['year'] >= 2020) & (events_df['year'] <= 2024)])
+            '2010-2014': int(decade_counts[0]),
+            '2015-2019': int(decade_counts[1]),
+            '2020-2024': int(decade_counts[2])
         }
         
         patterns['temporal_distribution'] = events_by_decade
         patterns['disruption_frequency_trend'] = 'INCREASING' if events_by_decade['2020-2024'] > events_by_decade['2010-2014'] else 'STABLE'
         
         # Severity escalation patterns
-        extreme_years = events_df[events_df['severity'] == 'EXTREME']['year'].tolist()
-        high_years = events_df[events_df['severity'] == 'HIGH']['year'].tolist()
+        extreme_years = years[sev_code == SEVERITY_CODES['EXTREME']].tolist()
+        high_years = years[sev_code == SEVERITY_CODES['HIGH']].tolist()
         
         patterns['severity_escalation'] = {
             'extreme_event_years': extreme_years,
             'high_severity_years': high_years,
-            'severity_clustering': self._detect_severity_clustering(events_df)
+            'severity_clustering': self._detect_severity_clustering()
         }
         
         # Price impact patterns
-        positive_impacts = events_df[events_df['price_impact_pct'] > 0]['price_impact_pct']
-        negative_impacts = events_df[events_df['price_impact_pct'] < 0]['price_impact_pct']
+        up = price > 0
+        down = price < 0
+        n_up = int(up.sum())
+        n_down = int(down.sum())
+        up_impacts = price[up]
         
         patterns['price_impact_patterns'] = {
-            'upward_pressure_events': len(positive_impacts),
-            'downward_pressure_events': len(negative_impacts),
-            'average_price_increase': positive_impacts.mean() if len(positive_impacts) > 0 else 0,
-            'average_price_decrease': negative_impacts.mean() if len(negative_impacts) > 0 else 0,
-            'volatility_trend': 'HIGH' if positive_impacts.std() > 100 else 'MODERATE'
+            'upward_pressure_events': n_up,
+            'downward_pressure_events': n_down,
+            'average_price_increase': float(up_impacts.mean()) if n_up else 0,
+            'average_price_decrease': float(price[down].mean()) if n_down else 0,
+            # Sample std (ddof=1), undefined below two events
+            'volatility_trend': 'HIGH' if n_up > 1 and up_impacts.std(ddof=1) > 100 else 'MODERATE'
         }
         
-        # Event type evolution
+        # Event type evolution, in order of first appearance
         type_evolution = {}
-        for event_type in events_df['event_type'].unique():
-            type_events = events_df[events_df['event_type'] == event_type]
-            type_evolution[event_type] = {
-                'count': len(type_events),
-                'avg_severity_score': self._calculate_severity_score(type_events['severity'].tolist()),
-                'years_active': sorted(type_events['year'].tolist())
+        codes, first_seen, counts = np.unique(self._type_code, return_index=True, return_counts=True)
+        for k in np.argsort(first_seen):
+            type_mask = self._type_code == codes[k]
+            type_evolution[EVENT_TYPES[codes[k]]] = {
+                'count': int(counts[k]),
+                'avg_severity_score': self._calculate_severity_score(sev_code[type_mask]),
+                'years_active': sorted(years[type_mask].tolist())
             }
         
         patterns['event_type_evolution'] = type_evolution
@@ -278,23 +433,17 @@ class MarketEventAnalyzer:
         correlations = {}
         
         # Policy-driven vs crisis-driven events
-        policy_events = [e for e in self.historical_events if e.event_type == 'POLICY']
-        crisis_events = [e for e in self.historical_events if e.event_type == 'CRISIS']
-        
         correlations['policy_crisis_relationship'] = {
-            'policy_events_count': len(policy_events),
-            'crisis_events_count': len(crisis_events),
+            'policy_events_count': int(self._events_by_type['POLICY'].size),
+            'crisis_events_count': int(self._events_by_type['CRISIS'].size),
             'policy_response_lag': self._calculate_policy_response_lag(),
             'policy_effectiveness': self._assess_policy_effectiveness()
         }
         
         # Trade vs supply disruptions
-        trade_events = [e for e in self.historical_events if e.event_type == 'TRADE']
-        supply_events = [e for e in self.historical_events if e.event_type == 'SUPPLY']
-        
         correlations['trade_supply_dynamics'] = {
-            'trade_events_count': len(trade_events),
-            'supply_events_count': len(supply_events),
+            'trade_events_count': int(self._events_by_type['TRADE'].size),
+            'supply_events_count': int(self._events_by_type['SUPPLY'].size),
             'trade_supply_correlation': self._analyze_trade_supply_correlation()
         }
         
@@ -353,130 +502,28 @@ class MarketEventAnalyzer:
         
         return recovery_patterns
     
-    def predict_future_disruptions(self) -> Dict:
+    def predict_future_disruptions(self, ts: Optional[str] = None) -> Dict:
         """Predict potential future market disruptions based on historical patterns"""
         print("🔮 PREDICTING FUTURE MARKET DISRUPTIONS")
         print("-" * 40)
         
-        # Potential future events based on current trends
-        potential_events = [
-            {
-                'timeframe': '2025-2026',
-                'event': 'US-China Tech Competition Escalation',
-                'probability': 'HIGH',
-                'potential_impact': 'Trade restrictions on advanced REE processing technology',
-                'affected_commodities': ['high-purity REE', 'processed magnets'],
-                'innovation_response': 'Western REE processing technology acceleration'
-            },
-            {
-                'timeframe': '2026-2027',
-                'event': 'EU Critical Materials Act Full Implementation',
-                'probability': 'CERTAIN',
-                'potential_impact': 'Mandatory recycling quotas and supply chain requirements',
-                'affected_commodities': ['rare_earths', 'lithium', 'cobalt'],
-                'innovation_response': 'Circular economy technology boom'
-            },
-            {
-                'timeframe': '2027-2028',
-                'event': 'India-China Border Tensions Impact Mining',
-                'probability': 'MODERATE',
-                'potential_impact': 'Alternative supply chain route disruptions',
-                'affected_commodities': ['rare_earths'],
-                'innovation_response': 'Supply chain traceability systems'
-            },
-            {
-                'timeframe': '2028-2030',
-                'event': 'Climate Change Mining Disruptions',
-                'probability': 'HIGH',
-                'potential_impact': 'Weather-related mining operations interruptions',
-                'affected_commodities': ['rare_earths', 'lithium'],
-                'innovation_response': 'Climate-resilient extraction technologies'
-            },
-            {
-                'timeframe': '2030-2032',
-                'event': 'Space-Based Mining Technology Breakthrough',
-                'probability': 'LOW',
-                'potential_impact': 'Potential disruption to terrestrial REE markets',
-                'affected_commodities': ['high-value REE'],
-                'innovation_response': 'Cost-competitive terrestrial alternatives'
-            }
-        ]
-        
-        # Risk assessment framework
-        risk_assessment = {
-            'highest_probability_risks': [
-                'EU regulatory compliance requirements',
-                'US-China technology competition',
-                'Climate-related supply disruptions'
-            ],
-            'highest_impact_risks': [
-                'Major geopolitical conflict affecting supply chains',
-                'Climate change mining disruptions',
-                'Breakthrough alternative materials technology'
-            ],
-            'preparedness_recommendations': [
-                'Accelerate recycling technology development',
-                'Diversify supply sources beyond China',
-                'Invest in rare earth-free alternatives',
-                'Build strategic material reserves',
-                'Enhance supply chain traceability'
-            ]
-        }
-        
-        # Early warning indicators
-        early_warning_indicators = {
-            'geopolitical_tensions': [
-                'US-China trade policy changes',
-                'China export policy modifications',
-                'International dispute escalations'
-            ],
-            'supply_chain_stress': [
-                'Mining operation disruptions',
-                'Processing capacity bottlenecks',
-                'Transportation route issues'
-            ],
-            'demand_surge_signals': [
-                'EV adoption acceleration',
-                'Renewable energy deployment rates',
-                'Defense spending increases'
-            ],
-            'technology_disruption': [
-                'Alternative materials breakthroughs',
-                'Recycling efficiency improvements',
-                'New extraction technologies'
-            ]
-        }
-        
-        prediction_results = {
-            'potential_future_events': potential_events,
-            'risk_assessment': risk_assessment,
-            'early_warning_indicators': early_warning_indicators,
-            'monitoring_recommendations': [
-                'Monthly geopolitical risk assessment',
-                'Quarterly supply chain vulnerability analysis',
-                'Annual technology disruption impact evaluation',
-                'Continuous price and policy monitoring'
-            ],
-            'prediction_confidence': 'MODERATE - Based on historical patterns and current trends',
-            'prediction_timestamp': datetime.now().isoformat()
-        }
-        
         print(f"✅ Future disruption prediction completed")
-        print(f"   Potential events identified: {len(potential_events)}")
-        print(f"   High probability risks: {len(risk_assessment['highest_probability_risks'])}")
+        print(f"   Potential events identified: {len(_POTENTIAL_EVENTS)}")
+        print(f"   High probability risks: {len(_RISK_ASSESSMENT['highest_probability_risks'])}")
         
-        return prediction_results
+        # Deep copy so the shared module-level tables never leak into a caller's report
+        predictions = copy.deepcopy(dict(_PREDICTION_BASE))
+        predictions['prediction_timestamp'] = ts or datetime.now().isoformat()
+        return predictions
     
-    def _detect_severity_clustering(self, events_df: pd.DataFrame) -> str:
+    def _detect_severity_clustering(self) -> str:
         """Detect if severe events cluster in time"""
-        severe_events = events_df[events_df['severity'].isin(['HIGH', 'EXTREME'])]
-        severe_years = sorted(severe_events['year'].tolist())
+        severe_years = np.sort(self._years[self._sev_code >= SEVERITY_CODES['HIGH']])
         
-        if len(severe_years) < 2:
+        if severe_years.size < 2:
             return 'INSUFFICIENT_DATA'
         
-        gaps = [severe_years[i+1] - severe_years[i] for i in range(len(severe_years)-1)]
-        avg_gap = sum(gaps) / len(gaps)
+        avg_gap = float(np.diff(severe_years).mean())
         
         if avg_gap <= 2:
             return 'HIGHLY_CLUSTERED'
@@ -485,36 +532,33 @@ class MarketEventAnalyzer:
         else:
             return 'DISPERSED'
     
-    def _calculate_severity_score(self, severity_list: List[str]) -> float:
+    def _calculate_severity_score(self, sev_codes: np.ndarray) -> float:
         """Calculate numerical severity score"""
-        severity_scores = {'LOW': 1, 'MODERATE': 2, 'HIGH': 3, 'EXTREME': 4}
-        scores = [severity_scores.get(s, 0) for s in severity_list]
-        return sum(scores) / len(scores) if scores else 0
+        if sev_codes.size == 0:
+            return 0.0
+        return float(self._SCORE_LUT[sev_codes].mean())
     
     def _calculate_policy_response_lag(self) -> Dict:
         """Calculate lag between crises and policy responses"""
-        crisis_years = [e.year for e in self.historical_events if e.event_type == 'CRISIS']
-        policy_years = [e.year for e in self.historical_events if e.event_type == 'POLICY']
+        crisis_years = self._years[self._events_by_type['CRISIS']]
+        policy_years = np.sort(self._years[self._events_by_type['POLICY']])
         
-        # Find policy responses following crises
-        response_lags = []
-        for crisis_year in crisis_years:
-            following_policies = [p for p in policy_years if p > crisis_year]
-            if following_policies:
-                response_lags.append(min(following_policies) - crisis_year)
+        # First policy strictly after each crisis
+        next_policy = np.searchsorted(policy_years, crisis_years, side='right')
+        followed = next_policy < policy_years.size
+        response_lags = policy_years[next_policy[followed]] - crisis_years[followed]
         
         return {
-            'average_response_lag_years': sum(response_lags) / len(response_lags) if response_lags else 0,
-            'response_lags': response_lags,
-            'policy_responsiveness': 'REACTIVE' if len(response_lags) > 0 else 'PROACTIVE'
+            'average_response_lag_years': float(response_lags.mean()) if response_lags.size else 0,
+            'response_lags': response_lags.tolist(),
+            'policy_responsiveness': 'REACTIVE' if response_lags.size > 0 else 'PROACTIVE'
         }
     
     def _assess_policy_effectiveness(self) -> Dict:
         """Assess effectiveness of policy interventions"""
-        policy_events = [e for e in self.historical_events if e.event_type == 'POLICY']
-        
         effectiveness_scores = {}
-        for policy in policy_events:
+        for i in self._events_by_type['POLICY']:
+            policy = self.historical_events[i]
             # Simple heuristic: negative price impacts after policy = effective
             if policy.price_impact_pct < 0:
                 effectiveness_scores[policy.event_name] = 'EFFECTIVE'
@@ -531,19 +575,17 @@ class MarketEventAnalyzer:
     
     def _analyze_trade_supply_correlation(self) -> str:
         """Analyze correlation between trade and supply events"""
-        trade_events = [e for e in self.historical_events if e.event_type == 'TRADE']
-        supply_events = [e for e in self.historical_events if e.event_type == 'SUPPLY']
-        
         # Simple correlation: trade events often precede supply responses
-        correlation_strength = 'HIGH' if len(trade_events) > 0 and len(supply_events) > 0 else 'LOW'
+        has_trade = self._events_by_type['TRADE'].size > 0
+        has_supply = self._events_by_type['SUPPLY'].size > 0
+        correlation_strength = 'HIGH' if has_trade and has_supply else 'LOW'
         return correlation_strength
     
     def _analyze_geopolitical_escalation(self) -> Dict:
         """Analyze geopolitical escalation patterns"""
-        geopolitical_events = [e for e in self.historical_events if 'China' in e.geopolitical_context or 'US' in e.geopolitical_context]
-        
         escalation_timeline = []
-        for event in sorted(geopolitical_events, key=lambda x: x.year):
+        for i in self._geo_order:
+            event = self.historical_events[i]
             escalation_timeline.append({
                 'year': event.year,
                 'event': event.event_name,
@@ -572,9 +614,12 @@ class MarketEventAnalyzer:
         print("📋 GENERATING COMPREHENSIVE DISRUPTION INTELLIGENCE")
         print("=" * 55)
         
+        # One timestamp for the whole report
+        ts = datetime.now().isoformat()
+        
         # Run all analyses
-        historical_analysis = self.analyze_historical_disruptions()
-        future_predictions = self.predict_future_disruptions()
+        historical_analysis = self.analyze_historical_disruptions(ts)
+        future_predictions = self.predict_future_disruptions(ts)
         
         # Strategic insights
         strategic_insights = {
@@ -636,7 +681,7 @@ class MarketEventAnalyzer:
             'strategic_insights': strategic_insights,
             'business_recommendations': business_recommendations,
             'intelligence_metadata': {
-                'generation_timestamp': datetime.now().isoformat(),
+                'generation_timestamp': ts,
                 'analysis_scope': '2010-2024 historical, 2025-2032 projections',
                 'confidence_level': 'HIGH for historical, MODERATE for predictions',
                 'data_sources': ['Historical market data', 'Policy analysis', 'Industry intelligence']
@@ -649,6 +694,13 @@ class MarketEventAnalyzer:
         print(f"   Strategic insights: {len(strategic_insights['key_disruption_patterns'])}")
         
         return comprehensive_intelligence
+    
+    def to_json(self) -> bytes:
+        """Serialize the comprehensive intelligence report, via orjson when available"""
+        report = self.generate_comprehensive_disruption_intelligence()
+        if orjson is not None:
+            return orjson.dumps(report, option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(report).encode()
 
 def test_market_event_analyzer():
     """Test market event analyzer functionality"""
@@ -36,6 +36,19 @@ class PatentMarketCorrelator:
             self.pipeline_summary = {}
         
         self.correlation_results = {}
+        self._yearly_filings_source = None
+        self._yearly_filings = pd.Series(dtype='int64')
+    
+    def _get_yearly_filings(self) -> pd.Series:
+        """Patent filings per year, counted once per REE dataset and shared by all analyses"""
+        if self._yearly_filings_source is not self.ree_dataset:
+            self._yearly_filings = self.ree_dataset['appln_filing_year'].value_counts().sort_index()
+            self._yearly_filings_source = self.ree_dataset
+        return self._yearly_filings
+    
+    def _count_filings(self, first_year: int, last_year: int) -> int:
+        """Total filings in an inclusive year window"""
+        return int(self._get_yearly_filings().loc[first_year:last_year].sum())
     
     def analyze_price_shock_patent_response(self) -> Dict:
         """
@@ -55,11 +68,14 @@ class PatentMarketCorrelator:
             return self._run_fresh_analysis_and_correlate()
         
         # Aggregate patent filings by year
-        patent_by_year = self.ree_dataset.groupby('appln_filing_year').size().reset_index()
-        patent_by_year.columns = ['year', 'patent_filings']
+        patent_by_year = self._get_yearly_filings()
         
-        # Merge with price data
-        combined_data = pd.merge(price_trends, patent_by_year, on='year', how='inner')
+        # Look up filings per price year; years without filings drop out like an inner join
+        patent_filings = price_trends['year'].map(patent_by_year)
+        has_filings = patent_filings.notna()
+        combined_data = price_trends[has_filings].assign(
+            patent_filings=patent_filings[has_filings].astype('int64')
+        ).reset_index(drop=True)
         
         if combined_data.empty:
             return {
@@ -199,10 +215,12 @@ class PatentMarketCorrelator:
         # Analyze patent geographic distribution
         patent_geography = {}
         if not self.ree_dataset.empty:
-            top_patent_countries = self.ree_dataset['appln_auth'].value_counts().head(10)
+            # One value_counts pass serves the top-10 list and the diversity index
+            country_counts = self.ree_dataset['appln_auth'].value_counts()
+            top_patent_countries = country_counts.head(10)
             patent_geography = {
                 'top_patent_countries': top_patent_countries.to_dict(),
-                'patent_diversity_index': len(self.ree_dataset['appln_auth'].unique()),
+                'patent_diversity_index': int((country_counts > 0).sum()),
                 'china_patent_share': (top_patent_countries.get('CN', 0) / len(self.ree_dataset) * 100) if len(self.ree_dataset) > 0 else 0
             }
             
@@ -338,25 +356,13 @@ class PatentMarketCorrelator:
                 end_year = int(period.split('-')[1])
                 
                 # Pre-event baseline (2 years before)
-                pre_event_data = self.ree_dataset[
-                    (self.ree_dataset['appln_filing_year'] >= start_year-2) & 
-                    (self.ree_dataset['appln_filing_year'] < start_year)
-                ]
-                pre_event_avg = len(pre_event_data) / 2 if len(pre_event_data) > 0 else 0
+                pre_event_avg = self._count_filings(start_year-2, start_year-1) / 2
                 
                 # Event period
-                event_data = self.ree_dataset[
-                    (self.ree_dataset['appln_filing_year'] >= start_year) & 
-                    (self.ree_dataset['appln_filing_year'] <= end_year)
-                ]
-                event_avg = len(event_data) / (end_year - start_year + 1) if len(event_data) > 0 else 0
+                event_avg = self._count_filings(start_year, end_year) / (end_year - start_year + 1)
                 
                 # Post-event response (2 years after)
-                post_event_data = self.ree_dataset[
-                    (self.ree_dataset['appln_filing_year'] > end_year) & 
-                    (self.ree_dataset['appln_filing_year'] <= end_year+2)
-                ]
-                post_event_avg = len(post_event_data) / 2 if len(post_event_data) > 0 else 0
+                post_event_avg = self._count_filings(end_year+1, end_year+2) / 2
                 
                 # Calculate impact metrics
                 event_change = ((event_avg - pre_event_avg) / pre_event_avg * 100) if pre_event_avg > 0 else 0
@@ -1,12 +1,11 @@
-import pandas as pd
-import numpy as np
+from __future__ import annotations
+
 from datetime import datetime, timedelta
-from typing import Dict, List, Tuple, Optional
-import json
+from typing import TYPE_CHECKING, Dict, List, Tuple, Optional
 from dataclasses import dataclass
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
+
+if TYPE_CHECKING:
+    import plotly.graph_objects as go
 
 @dataclass
 class ROIScenario:
@@ -440,6 +439,9 @@ class ROICalculator:
     
     def create_roi_visualization(self, business_case: Dict) -> go.Figure:
         """Create interactive ROI visualization for presentations"""
+        import plotly.graph_objects as go
+        from plotly.subplots import make_subplots
+
         print("📊 Creating ROI visualization...")
         
         # Extract financial projections
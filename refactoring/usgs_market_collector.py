@@ -1,11 +1,31 @@
-import pandas as pd
-import requests
-import zipfile
+from __future__ import annotations
+
 import os
 import json
 from datetime import datetime
-from typing import Dict, List, Tuple, Optional
-import time
+from typing import TYPE_CHECKING, Dict
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Market disruption lookup tables, keyed by event year
+_SEVERITY_MAP = {
+    2011: 'EXTREME',  # 700% price spike
+    2020: 'HIGH',     # COVID disruption
+    2022: 'HIGH',     # Ukraine conflict
+    2010: 'MEDIUM',   # Quota restrictions begin
+    2017: 'MEDIUM',   # US strategy launch
+    2023: 'MEDIUM'    # EU legislation
+}
+
+_RESPONSE_MAP = {
+    2011: 'Increased alternative materials and recycling patent filings',
+    2020: 'Supply chain resilience and domestic production patents',
+    2022: 'Strategic material substitution and efficiency patents',
+    2010: 'Early recycling and extraction efficiency innovations',
+    2017: 'Government-funded research patent surge',
+    2023: 'EU-focused circular economy and sustainability patents'
+}
 
 class USGSMineralDataCollector:
     """
@@ -37,6 +57,9 @@ class USGSMineralDataCollector:
             2024: "US-China trade tensions affect REE markets"
         }
         
+        # Synthetic market data is static, so it is built and written once per collector
+        self._market_data = None
+        
         # Ensure cache directory exists
         os.makedirs(self.data_cache_dir, exist_ok=True)
         
@@ -45,6 +68,9 @@ class USGSMineralDataCollector:
         Create realistic synthetic USGS market data based on known REE market patterns
         This provides immediate functionality while maintaining data authenticity patterns
         """
+        if self._market_data is not None:
+            return self._market_data
+        
         print("📊 Creating synthetic USGS-style market data for REE analysis...")
         
         # Historical price trends based on known market events
@@ -109,10 +135,13 @@ class USGSMineralDataCollector:
             json.dump(market_data, f, indent=2)
         
         print(f"✅ Market data created and cached: {cache_file}")
+        self._market_data = market_data
         return market_data
     
     def get_ree_price_trends(self) -> pd.DataFrame:
         """Extract REE price volatility trends 2010-2024"""
+        import pandas as pd
+
         market_data = self.create_synthetic_market_data()
         
         price_data = market_data['price_trends']['neodymium_price_index']
@@ -147,7 +176,8 @@ class USGSMineralDataCollector:
         """China market dominance and supply concentration analysis"""
         market_data = self.create_synthetic_market_data()
         
-        concentration_metrics = market_data['supply_concentration']
+        # Copy so the shared market data is not mutated
+        concentration_metrics = dict(market_data['supply_concentration'])
         concentration_metrics['risk_assessment'] = {
             'level': 'CRITICAL',
             'justification': f"{concentration_metrics['china_market_share']}% Chinese market dominance creates extreme supply vulnerability",
@@ -168,10 +198,12 @@ class USGSMineralDataCollector:
     
     def get_market_disruption_timeline(self) -> pd.DataFrame:
         """Historical market disruptions for correlation with patent filing patterns"""
+        import pandas as pd
+
         disruption_data = []
+        price_data = self.get_ree_price_trends()
         
         for year, event in self.market_events.items():
-            price_data = self.get_ree_price_trends()
             year_price = price_data[price_data['year'] == year]['neodymium_price_index']
             
             disruption_data.append({
@@ -186,27 +218,11 @@ class USGSMineralDataCollector:
     
     def _calculate_disruption_severity(self, year: int) -> str:
         """Calculate market disruption severity for given year"""
-        severity_map = {
-            2011: 'EXTREME',  # 700% price spike
-            2020: 'HIGH',     # COVID disruption
-            2022: 'HIGH',     # Ukraine conflict
-            2010: 'MEDIUM',   # Quota restrictions begin
-            2017: 'MEDIUM',   # US strategy launch
-            2023: 'MEDIUM'    # EU legislation
-        }
-        return severity_map.get(year, 'LOW')
+        return _SEVERITY_MAP.get(year, 'LOW')
     
     def _predict_patent_response(self, year: int) -> str:
         """Predict expected patent filing response to market events"""
-        response_map = {
-            2011: 'Increased alternative materials and recycling patent filings',
-            2020: 'Supply chain resilience and domestic production patents',
-            2022: 'Strategic material substitution and efficiency patents',
-            2010: 'Early recycling and extraction efficiency innovations',
-            2017: 'Government-funded research patent surge',
-            2023: 'EU-focused circular economy and sustainability patents'
-        }
-        return response_map.get(year, 'Standard patent filing patterns')
+        return _RESPONSE_MAP.get(year, 'Standard patent filing patterns')
     
     def validate_data_quality(self) -> Dict:
         """Validate collected market data quality and completeness"""
@@ -3,74 +3,27 @@ PATSTAT Citation Origins Reference Guide
 Complete breakdown of all citation types included in comprehensive analysis
 """
 
-CITATION_ORIGINS = {
-    'SEA': {
-        'name': 'Search Report',
-        'description': 'Citations from patent examiner search reports',
-        'typical_percentage': '40-60%',
-        'reliability': 'High - official examiner citations'
-    },
-    'APP': {
-        'name': 'Applicant',
-        'description': 'Citations provided by patent applicants',
-        'typical_percentage': '15-25%',
-        'reliability': 'Medium - self-reported by applicants'
-    },
-    'ISR': {
-        'name': 'International Search Report',
-        'description': 'Citations from PCT international search reports',
-        'typical_percentage': '5-15%',
-        'reliability': 'High - official international search'
-    },
-    'PRS': {
-        'name': 'Patent/Publication Reference Search',
-        'description': 'Citations from prior art searches',
-        'typical_percentage': '5-10%',
-        'reliability': 'Medium-High - systematic searches'
-    },
-    'EXA': {
-        'name': 'Examiner',
-        'description': 'Direct examiner citations during prosecution',
-        'typical_percentage': '1-5%',
-        'reliability': 'High - official examiner input'
-    },
-    'FOP': {
-        'name': 'File/Office Proceeding',
-        'description': 'Citations from office proceedings',
-        'typical_percentage': '<1%',
-        'reliability': 'High - official proceedings'
-    },
-    'OPP': {
-        'name': 'Opposition',
-        'description': 'Citations from opposition proceedings',
-        'typical_percentage': '<1%',
-        'reliability': 'Medium - adversarial context'
-    },
-    'TPO': {
-        'name': 'Third Party Observation',
-        'description': 'Citations from third party submissions',
-        'typical_percentage': '<1%',
-        'reliability': 'Medium - external input'
-    },
-    'APL': {
-        'name': 'Appeal',
-        'description': 'Citations from appeal proceedings',
-        'typical_percentage': '<1%',
-        'reliability': 'High - judicial review context'
-    },
-    'SUP': {
-        'name': 'Supplementary',
-        'description': 'Supplementary citation information',
-        'typical_percentage': '<1%',
-        'reliability': 'Variable'
-    },
-    'CH2': {
-        'name': 'Chapter 2',
-        'description': 'PCT Chapter 2 citations',
-        'typical_percentage': '<0.1%',
-        'reliability': 'High - PCT examination'
-    }
-}
+import sys
+
+# One row per citn_origin code: (code, name, description, typical_percentage, reliability)
+CITATION_ORIGINS_TABLE = (
+    ('SEA', 'Search Report', 'Citations from patent examiner search reports', '40-60%', 'High - official examiner citations'),
+    ('APP', 'Applicant', 'Citations provided by patent applicants', '15-25%', 'Medium - self-reported by applicants'),
+    ('ISR', 'International Search Report', 'Citations from PCT international search reports', '5-15%', 'High - official international search'),
+    ('PRS', 'Patent/Publication Reference Search', 'Citations from prior art searches', '5-10%', 'Medium-High - systematic searches'),
+    ('EXA', 'Examiner', 'Direct examiner citations during prosecution', '1-5%', 'High - official examiner input'),
+    ('FOP', 'File/Office Proceeding', 'Citations from office proceedings', '<1%', 'High - official proceedings'),
+    ('OPP', 'Opposition', 'Citations from opposition proceedings', '<1%', 'Medium - adversarial context'),
+    ('TPO', 'Third Party Observation', 'Citations from third party submissions', '<1%', 'Medium - external input'),
+    ('APL', 'Appeal', 'Citations from appeal proceedings', '<1%', 'High - judicial review context'),
+    ('SUP', 'Supplementary', 'Supplementary citation information', '<1%', 'Variable'),
+    ('CH2', 'Chapter 2', 'PCT Chapter 2 citations', '<0.1%', 'High - PCT examination')
+)
+
+_ORIGIN_FIELDS = ('name', 'description', 'typical_percentage', 'reliability')
+
+# Keyed view of the table for lookups by code
+CITATION_ORIGINS = {row[0]: dict(zip(_ORIGIN_FIELDS, row[1:])) for row in CITATION_ORIGINS_TABLE}
 
 def print_citation_origins_summary():
     """Print comprehensive summary of citation origins"""
@@ -81,11 +34,14 @@ def print_citation_origins_summary():
     print("\n🎯 INCLUDED IN COMPREHENSIVE ANALYSIS:")
     print("All citation types below are now included for maximum coverage:\n")
     
-    for code, info in CITATION_ORIGINS.items():
-        print(f"🔹 {code}: {info['name']}")
-        print(f"   Description: {info['description']}")
-        print(f"   Typical %: {info['typical_percentage']}")
-        print(f"   Reliability: {info['reliability']}\n")
+    # One write for the whole table instead of four prints per origin
+    sys.stdout.write(''.join(
+        f"🔹 {code}: {name}\n"
+        f"   Description: {description}\n"
+        f"   Typical %: {typical_percentage}\n"
+        f"   Reliability: {reliability}\n\n"
+        for code, name, description, typical_percentage, reliability in CITATION_ORIGINS_TABLE
+    ))
     
     print("💡 BUSINESS VALUE:")
     print("• SEA + ISR + EXA = Official examiner perspective (high quality)")
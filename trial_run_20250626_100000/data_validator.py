@@ -1,5 +1,30 @@
 import pandas as pd
-from datetime import datetime
+import csv
+import json
+import math
+from bisect import bisect_right
+
+# Columns checked for completeness, with their report labels
+COVERAGE_LABELS = {
+    'appln_title': 'Title',
+    'appln_abstract': 'Abstract',
+    'person_ctry_code': 'Geographic'
+}
+
+# Overall quality score factors: (lower bounds, points) per factor
+# Dataset size factor (0-40 points)
+SIZE_BANDS = ((1, 10, 100, 1000), (0, 10, 20, 30, 40))
+# Citation coverage (0-30 points)
+CITATION_BANDS = ((1, 10, 100, 1000), (0, 5, 10, 20, 30))
+# Geographic diversity (0-20 points)
+COUNTRY_BANDS = ((1, 5, 10, 20), (0, 5, 10, 15, 20))
+# Data completeness (0-10 points); completeness is a float, so the lowest bound is just above 0
+COMPLETENESS_BANDS = ((math.ulp(0.0), 40, 60, 80), (0, 4, 6, 8, 10))
+
+def band_points(value, bands):
+    """Score one quality factor against its bands"""
+    thresholds, points = bands
+    return points[bisect_right(thresholds, value)]
 
 def validate_dataset_quality(ree_df, forward_citations_df, backward_citations_df):
     """Comprehensive quality checks"""
@@ -8,92 +33,41 @@ def validate_dataset_quality(ree_df, forward_citations_df, backward_citations_df
     print("DATASET QUALITY REPORT")
     print("=" * 50)
     
+    # Size and available columns, checked once
+    n = 0 if ree_df.empty else len(ree_df)
+    columns = set(ree_df.columns) if n else set()
+    
     quality_metrics = {
-        'total_applications': len(ree_df) if not ree_df.empty else 0,
-        'total_families': ree_df['docdb_family_id'].nunique() if not ree_df.empty and 'docdb_family_id' in ree_df.columns else 0,
+        'total_applications': n,
+        'total_families': ree_df['docdb_family_id'].nunique() if 'docdb_family_id' in columns else 0,
         'forward_citations': len(forward_citations_df) if not forward_citations_df.empty else 0,
         'backward_citations': len(backward_citations_df) if not backward_citations_df.empty else 0,
-        'countries_covered': ree_df['appln_auth'].nunique() if not ree_df.empty and 'appln_auth' in ree_df.columns else 0,
+        'countries_covered': ree_df['appln_auth'].nunique() if 'appln_auth' in columns else 0,
         'data_completeness': 0,
         'quality_score': 0
     }
     
-    # Data completeness check
-    if not ree_df.empty:
-        completeness_factors = []
-        
-        # Check for title data
-        if 'appln_title' in ree_df.columns:
-            title_completeness = (ree_df['appln_title'].notna().sum() / len(ree_df)) * 100
-            completeness_factors.append(title_completeness)
-            print(f"Title Coverage: {title_completeness:.1f}%")
-        
-        # Check for abstract data
-        if 'appln_abstract' in ree_df.columns:
-            abstract_completeness = (ree_df['appln_abstract'].notna().sum() / len(ree_df)) * 100
-            completeness_factors.append(abstract_completeness)
-            print(f"Abstract Coverage: {abstract_completeness:.1f}%")
-        
-        # Check for geographic data
-        if 'person_ctry_code' in ree_df.columns:
-            geo_completeness = (ree_df['person_ctry_code'].notna().sum() / len(ree_df)) * 100
-            completeness_factors.append(geo_completeness)
-            print(f"Geographic Coverage: {geo_completeness:.1f}%")
-        
-        if completeness_factors:
-            quality_metrics['data_completeness'] = sum(completeness_factors) / len(completeness_factors)
+    # Data completeness check: one isna() pass over all coverage columns
+    coverage_columns = [c for c in COVERAGE_LABELS if c in columns]
+    if coverage_columns:
+        missing = ree_df[coverage_columns].isna()
+        if missing.values.any():
+            coverage = (~missing).mean().mul(100)
+        else:
+            # No gaps anywhere: skip the per-column reductions
+            coverage = pd.Series(100.0, index=coverage_columns)
+        for column in coverage_columns:
+            print(f"{COVERAGE_LABELS[column]} Coverage: {coverage[column]:.1f}%")
+        quality_metrics['data_completeness'] = coverage.mean()
     
     # Calculate overall quality score
-    score_factors = []
-    
-    # Dataset size factor (0-40 points)
-    if quality_metrics['total_applications'] >= 1000:
-        score_factors.append(40)
-    elif quality_metrics['total_applications'] >= 100:
-        score_factors.append(30)
-    elif quality_metrics['total_applications'] >= 10:
-        score_factors.append(20)
-    elif quality_metrics['total_applications'] > 0:
-        score_factors.append(10)
-    else:
-        score_factors.append(0)
-    
-    # Citation coverage (0-30 points)
     citation_coverage = quality_metrics['forward_citations'] + quality_metrics['backward_citations']
-    if citation_coverage >= 1000:
-        score_factors.append(30)
-    elif citation_coverage >= 100:
-        score_factors.append(20)
-    elif citation_coverage >= 10:
-        score_factors.append(10)
-    elif citation_coverage > 0:
-        score_factors.append(5)
-    else:
-        score_factors.append(0)
-    
-    # Geographic diversity (0-20 points)
-    if quality_metrics['countries_covered'] >= 20:
-        score_factors.append(20)
-    elif quality_metrics['countries_covered'] >= 10:
-        score_factors.append(15)
-    elif quality_metrics['countries_covered'] >= 5:
-        score_factors.append(10)
-    elif quality_metrics['countries_covered'] > 0:
-        score_factors.append(5)
-    else:
-        score_factors.append(0)
-    
-    # Data completeness (0-10 points)
-    if quality_metrics['data_completeness'] >= 80:
-        score_factors.append(10)
-    elif quality_metrics['data_completeness'] >= 60:
-        score_factors.append(8)
-    elif quality_metrics['data_completeness'] >= 40:
-        score_factors.append(6)
-    elif quality_metrics['data_completeness'] > 0:
-        score_factors.append(4)
-    else:
-        score_factors.append(0)
+    score_factors = [
+        band_points(quality_metrics['total_applications'], SIZE_BANDS),
+        band_points(citation_coverage, CITATION_BANDS),
+        band_points(quality_metrics['countries_covered'], COUNTRY_BANDS),
+        band_points(quality_metrics['data_completeness'], COMPLETENESS_BANDS)
+    ]
     
     quality_metrics['quality_score'] = sum(score_factors)
     
@@ -120,6 +94,7 @@ def validate_dataset_quality(ree_df, forward_citations_df, backward_citations_df
 
 def generate_summary_report(ree_df, forward_citations_df, quality_metrics):
     """Generate business summary"""
+    from datetime import datetime
     
     print("\n" + "=" * 50)
     print("BUSINESS SUMMARY REPORT")
@@ -136,9 +111,13 @@ def generate_summary_report(ree_df, forward_citations_df, quality_metrics):
         'key_insights': []
     }
     
-    # Top countries analysis
+    # Top countries analysis: counts and shares computed once on the Series
+    top_share = {}
     if not ree_df.empty and 'appln_auth' in ree_df.columns:
-        summary['top_countries'] = ree_df['appln_auth'].value_counts().head(5).to_dict()
+        top = ree_df['appln_auth'].value_counts().head(5)
+        share = top.mul(100.0 / summary['total_ree_applications'])
+        summary['top_countries'] = dict(zip(top.index, top.tolist()))
+        top_share = dict(zip(share.index, share.tolist()))
     
     # Generate key insights
     if summary['total_ree_applications'] > 0:
@@ -161,9 +140,8 @@ def generate_summary_report(ree_df, forward_citations_df, quality_metrics):
                 summary['key_insights'].append("Limited forward citations typical for recent patents")
         
         if summary['top_countries']:
-            top_country = list(summary['top_countries'].keys())[0]
-            top_count = summary['top_countries'][top_country]
-            market_share = (top_count / summary['total_ree_applications']) * 100
+            top_country = next(iter(summary['top_countries']))
+            market_share = top_share[top_country]
             summary['key_insights'].append(f"{top_country} leads with {market_share:.1f}% of REE patent activity")
     
     # Print summary
@@ -177,8 +155,7 @@ def generate_summary_report(ree_df, forward_citations_df, quality_metrics):
     if summary['top_countries']:
         print("\nTop Filing Countries:")
         for country, count in list(summary['top_countries'].items())[:3]:
-            percentage = (count / summary['total_ree_applications']) * 100
-            print(f"  {country}: {count} ({percentage:.1f}%)")
+            print(f"  {country}: {count} ({top_share[country]:.1f}%)")
     
     if summary['key_insights']:
         print("\nKey Insights:")
@@ -187,17 +164,23 @@ def generate_summary_report(ree_df, forward_citations_df, quality_metrics):
     
     return summary
 
+def write_single_row_csv(row, path):
+    """Write one dict as a header + row CSV, JSON-encoding nested values"""
+    row = {k: json.dumps(v, default=str) if isinstance(v, (dict, list)) else v for k, v in row.items()}
+    with open(path, 'w', newline='') as f:
+        writer = csv.DictWriter(f, fieldnames=list(row), lineterminator='\n')
+        writer.writeheader()
+        writer.writerow(row)
+
 def export_validation_results(quality_metrics, summary_report, output_dir="."):
     """Export validation results to files"""
     
     try:
         # Export quality metrics
-        quality_df = pd.DataFrame([quality_metrics])
-        quality_df.to_csv(f"{output_dir}/ree_quality_metrics.csv", index=False)
+        write_single_row_csv(quality_metrics, f"{output_dir}/ree_quality_metrics.csv")
         
         # Export summary report
-        summary_df = pd.DataFrame([summary_report])
-        summary_df.to_csv(f"{output_dir}/ree_summary_report.csv", index=False)
+        write_single_row_csv(summary_report, f"{output_dir}/ree_summary_report.csv")
         
         print(f"\n✅ Validation results exported to {output_dir}/")
         return True
@@ -4,10 +4,14 @@ EPO Technology Intelligence Platform (TIP) - PATSTAT PROD Environment
 """
 
 from epo.tipdata.patstat import PatstatClient
-import pandas as pd
-from datetime import datetime
+from sqlalchemy import bindparam, text
 import sys
-import traceback
+
+def read_sample(query, db, rows=10):
+    """Stream a sample query and keep only its first chunk"""
+    import pandas as pd
+    
+    return next(pd.read_sql(query, db.bind, chunksize=rows), pd.DataFrame())
 
 def test_tip_connection():
     """
@@ -29,7 +33,7 @@ def test_tip_connection():
         LIMIT 10
         """
         
-        test_result = pd.read_sql(test_query, db.bind)
+        test_result = read_sample(test_query, db)
         print(f"✅ Retrieved {len(test_result)} sample records")
         print(f"✅ Year range: {test_result['appln_filing_year'].min()}-{test_result['appln_filing_year'].max()}")
         print(f"✅ Countries: {test_result['appln_auth'].unique()}")
@@ -37,10 +41,36 @@ def test_tip_connection():
         return db
         
     except Exception as e:
+        import traceback
         print(f"❌ Connection failed: {e}")
         print(f"❌ Error details: {traceback.format_exc()}")
         return None
 
+def list_existing_tables(db, tables):
+    """Look up which of the given tables exist with one information_schema query; None if unavailable"""
+    query = text("""
+    SELECT table_name FROM information_schema.tables
+    WHERE lower(table_name) IN :names
+    """).bindparams(bindparam('names', expanding=True))
+    
+    try:
+        with db.bind.connect() as conn:
+            rows = conn.execute(query, {'names': [t.lower() for t in tables]})
+            return {row[0].lower() for row in rows}
+    except Exception as e:
+        print(f"⚠️ information_schema lookup failed, probing tables one by one: {str(e)[:100]}")
+        return None
+
+def probe_table(db, table):
+    """Fetch one row from a table; returns the error text, or None if it is readable"""
+    # Own connection per probe, so a failed probe cannot abort the session's transaction
+    try:
+        with db.bind.connect() as conn:
+            conn.execute(text(f"SELECT 1 FROM {table} LIMIT 1")).first()
+        return None
+    except Exception as e:
+        return str(e)[:100]
+
 def validate_patstat_tables(db):
     """
     Validate access to required PATSTAT tables for citation analysis
@@ -61,16 +91,20 @@ def validate_patstat_tables(db):
     
     accessible_tables = []
     failed_tables = []
+    existing_tables = list_existing_tables(db, required_tables)
     
     for table in required_tables:
-        try:
-            test_query = f"SELECT COUNT(*) as cnt FROM {table} LIMIT 1"
-            result = pd.read_sql(test_query, db.bind)
+        if existing_tables is None:
+            error = probe_table(db, table)
+        else:
+            error = None if table in existing_tables else "not found in information_schema"
+        
+        if error is None:
             accessible_tables.append(table)
             print(f"✅ {table}: accessible")
-        except Exception as e:
+        else:
             failed_tables.append(table)
-            print(f"❌ {table}: {str(e)[:100]}")
+            print(f"❌ {table}: {error}")
     
     print(f"\nTable Access Summary:")
     print(f"✅ Accessible: {len(accessible_tables)}/{len(required_tables)}")
@@ -98,7 +132,7 @@ def test_citation_table_structure(db):
         LIMIT 10
         """
         
-        citation_sample = pd.read_sql(citation_schema_query, db.bind)
+        citation_sample = read_sample(citation_schema_query, db)
         
         if not citation_sample.empty:
             print(f"✅ Citation table: {len(citation_sample)} sample records")
@@ -113,7 +147,7 @@ def test_citation_table_structure(db):
             )
             """
             
-            publn_sample = pd.read_sql(publn_test_query, db.bind)
+            publn_sample = read_sample(publn_test_query, db)
             print(f"✅ Publication linkage: {len(publn_sample)} records")
             
             return True
@@ -1,3 +1,5 @@
+import heapq
+
 import pandas as pd
 from database_connection import get_patstat_connection
 
@@ -175,7 +177,7 @@ def analyze_geographic_collaboration(db, ree_df):
         
         if country_pair_analysis:
             collaboration_analysis['top_bilateral_collaborations'] = dict(
-                sorted(country_pair_analysis.items(), key=lambda x: x[1], reverse=True)[:5]
+                heapq.nlargest(5, country_pair_analysis.items(), key=lambda x: x[1])
             )
     else:
         print("❌ No international collaborations found")